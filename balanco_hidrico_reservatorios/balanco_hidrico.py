@@ -1,22 +1,29 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 from datetime import date
-from calendar import monthrange
-from typing import Literal, TypedDict, Annotated
+from typing import TYPE_CHECKING, Literal, TypedDict, Annotated
 
-import pandas as pd
+from numpy.typing import NDArray
 
+from balanco_hidrico_reservatorios.calendario import calcula_fatores_q_para_vol
 from balanco_hidrico_reservatorios.conversor import converte_para
-from balanco_hidrico_reservatorios.evaporacao_do_lago import (
-    calcula_volume_evaporado_do_lago as calc_evp,
+from balanco_hidrico_reservatorios.nucleo import (
+    Backend,
+    PrioridadeDeAtendimento,
+    calcula_balanco_hidrico_em_arrays,
 )
 from balanco_hidrico_reservatorios.reservatorios import Reservatorio
 from balanco_hidrico_reservatorios.serie_temporal import (
     SerieTemporal,
+    ValoresSerieTemporal,
     _checa_falhas_nas_datas_da_serie_temporal,
     _checa_indice_da_serie_temporal,
-    _checa_nome_das_colunas,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 class ResultadoBHNoPeriodo(TypedDict):
     periodo: pd.Period
     cota_inicial: float
@@ -35,172 +42,107 @@ class ResultadoBHNoPeriodo(TypedDict):
     volume_evaporado_hm3: float
     volume_precipitado_hm3: float
 
-PrioridadeDeAtendimento = Literal["Vazão Turbinada", "Vazão das Demandas"]
-
 
 def calcula_balanco_hidrico(
     reservatorio: Reservatorio,
     serie_temporal: SerieTemporal | None,
     percentual_volume_inicial: int,
-    prioridade_de_atendimento: PrioridadeDeAtendimento 
+    prioridade_de_atendimento: PrioridadeDeAtendimento,
+    backend: Backend = 'python'
 ) -> list[ResultadoBHNoPeriodo]:
     
+    serie_temporal, volume_inicial = _prepara_balanco_hidrico(reservatorio, serie_temporal, percentual_volume_inicial)
+    
+    return _calcula_balanco_hidrico_a_partir_do_volume(
+        reservatorio=reservatorio,
+        serie_temporal=serie_temporal,
+        volume_inicial=volume_inicial,
+        prioridade_de_atendimento=prioridade_de_atendimento,
+        backend=backend
+    )
+
+
+def _prepara_balanco_hidrico(
+    reservatorio: Reservatorio,
+    serie_temporal: SerieTemporal | None,
+    percentual_volume_inicial: int
+) -> tuple[SerieTemporal, float]:
+    """Valida o percentual do volume inicial e a série temporal (a do reservatório, quando None) e
+    retorna a série e o volume inicial correspondente ao percentual do volume útil."""
+
     if percentual_volume_inicial < 0 or percentual_volume_inicial > 100:
         raise ValueError("Percentual do Volume Inicial deve estar entre 0 e 100")
-    
+
     serie_temporal = reservatorio.serie_temporal if serie_temporal is None else serie_temporal
-    resultado: list[ResultadoBHNoPeriodo] = []
+    _checa_indice_da_serie_temporal(serie_temporal.dataframe, freq=serie_temporal.freq)
+    _checa_falhas_nas_datas_da_serie_temporal(serie_temporal.dataframe, freq=serie_temporal.freq)
+
+    volume_maximo = reservatorio.volume.maximo
+    volume_minimo = reservatorio.volume.minimo
+    volume_inicial = volume_minimo + (volume_maximo - volume_minimo) * percentual_volume_inicial / 100
+
+    return serie_temporal, volume_inicial
+
+
+def _calcula_balanco_hidrico_a_partir_do_volume(
+    reservatorio: Reservatorio,
+    serie_temporal: SerieTemporal,
+    volume_inicial: float,
+    prioridade_de_atendimento: PrioridadeDeAtendimento,
+    backend: Backend = 'python'
+) -> list[ResultadoBHNoPeriodo]:
+    
     df_serie = serie_temporal.dataframe
     freq = serie_temporal.freq
-    nome_das_colunas = serie_temporal.nome_das_colunas
-    
-    _checa_indice_da_serie_temporal(df_serie, freq=freq)
-    _checa_falhas_nas_datas_da_serie_temporal(df_serie, freq=freq)
-    _checa_nome_das_colunas(df_serie, list(nome_das_colunas.values())) # type: ignore
+    valores = serie_temporal.valores
     
     volume_maximo = reservatorio.volume.maximo
     volume_minimo = reservatorio.volume.minimo
-    volume_inicial = volume_minimo + (volume_maximo - volume_minimo) * percentual_volume_inicial / 100
-
+    fatores_q_para_vol = calcula_fatores_q_para_vol(df_serie.index, freq=freq)
     
-    for index, row in df_serie.iterrows():
-        if freq == "D":
-            periodo = pd.to_datetime(index)  # type: ignore
-        if freq == "M":
-            periodo = pd.Period(index)  # type: ignore
-        
-        nome_colunas = reservatorio.serie_temporal.nome_das_colunas
-        vazao_afluente = row[nome_colunas['vazao_afluente']]
-        vazao_turbinada = row[nome_colunas['vazao_turbinada']]
-        vazao_retirada = row[nome_colunas['vazao_retirada']]
-        evaporacao = row[nome_colunas['evaporacao']]
-        precipitacao = row[nome_colunas['precipitacao']]
-        
-        if freq == "D":
-            factor_q_to_vol = 0.086400
-        if freq == "M":
-            factor_q_to_vol = 0.086400 * monthrange(periodo.year, periodo.month)[1]
-            
-        volume_vertido = 0.0
-        volume_afluente = vazao_afluente * factor_q_to_vol
-        volume_turbinado = vazao_turbinada * factor_q_to_vol
-        volume_retirada = vazao_retirada * factor_q_to_vol
-        cota_inicial = reservatorio.cav.calcula_cota_por(volume=volume_inicial)
-        area_corresp_inicial = reservatorio.cav.calcula_area_por(cota=cota_inicial)
-        volume_final = volume_inicial + volume_afluente - volume_turbinado - volume_retirada\
-            + area_corresp_inicial * (precipitacao - evaporacao) / 1_000
+    saida = calcula_balanco_hidrico_em_arrays(
+        volume_inicial=volume_inicial,
+        volume_minimo=volume_minimo,
+        volume_maximo=volume_maximo,
+        prioridade_de_atendimento=prioridade_de_atendimento,
+        vazoes_afluentes=valores.vazao_afluente,
+        vazoes_turbinadas=valores.vazao_turbinada,
+        vazoes_retiradas=valores.vazao_retirada,
+        evaporacoes=valores.evaporacao,
+        precipitacoes=valores.precipitacao,
+        fatores_q_para_vol=fatores_q_para_vol,
+        tabela_cav=reservatorio.cav.tabela(),
+        backend=backend
+    )
     
-        if volume_final  > volume_maximo:
-            volume_vertido = volume_final - volume_maximo
-            cota_max = reservatorio.cav.calcula_cota_por(volume=volume_maximo)
-            area_max = reservatorio.cav.calcula_area_por(cota=cota_max)
-            volume_evap_lago = area_max * evaporacao / 1_000
-            volume_prec_lago = area_max * precipitacao / 1_000
-            volume_final = min(volume_maximo,  volume_inicial + volume_afluente - volume_turbinado\
-                - volume_retirada + area_max * (precipitacao - evaporacao) / 1_000)
-            
-            bal_hidrico_periodo: ResultadoBHNoPeriodo = {
-                'periodo': periodo,
-                'cota_inicial': cota_inicial,
-                'cota_final': cota_max,
-                'vazao_afluente_m3_s': vazao_afluente,
-                'vazao_turbinada_m3_s': vazao_turbinada,
-                'vazao_demandas_m3_s': vazao_retirada,
-                'precipitacao_mm': precipitacao,
-                'evaporacao_mm': evaporacao,
-                'area_lago_km2': area_max,
-                'volume_afluente_hm3': volume_afluente,
-                'volume_turbinado_hm3': volume_turbinado,
-                'volume_inicial_hm3': volume_inicial,
-                'volume_final_hm3':  volume_final,
-                'volume_vertido_hm3': volume_vertido,
-                'volume_evaporado_hm3': volume_evap_lago,
-                'volume_precipitado_hm3': volume_prec_lago
-            }    
-
-        elif volume_final <= volume_minimo:
-            volume_final = volume_minimo
-            volume_vertido = 0
-            cota_final = reservatorio.cav.calcula_cota_por(volume=volume_final)
-            area_corresp_final = reservatorio.cav.calcula_area_por(cota=cota_final)
-            
-            volume_evap_lago = area_corresp_final * evaporacao / 1_000
-            volume_prec_lago = area_corresp_final * precipitacao / 1_000
-            
-            delta_vol = max(0, volume_inicial - volume_minimo - volume_evap_lago + volume_prec_lago)
-        
-            if prioridade_de_atendimento == "Vazão das Demandas":
-                vazao_retirada = min(vazao_retirada, delta_vol / factor_q_to_vol)
-                volume_retirada = vazao_retirada * factor_q_to_vol
-                delta_vol = max(0, volume_inicial - volume_minimo + volume_afluente\
-                    -volume_retirada - volume_evap_lago + volume_prec_lago)
-                vazao_turbinada = min(vazao_turbinada, delta_vol / factor_q_to_vol)
-                volume_turbinado = vazao_turbinada * factor_q_to_vol
-                
-            if prioridade_de_atendimento == "Vazão Turbinada":
-                vazao_turbinada = min(vazao_turbinada, delta_vol / factor_q_to_vol)
-                volume_turbinado = vazao_turbinada * factor_q_to_vol
-                delta_vol = max(0, volume_inicial - volume_minimo + volume_afluente\
-                    - volume_turbinado - volume_evap_lago + volume_prec_lago)
-                vazao_retirada = min(vazao_retirada, delta_vol / factor_q_to_vol)
-                volume_retirada = vazao_retirada * factor_q_to_vol
-            
-            bal_hidrico_periodo: ResultadoBHNoPeriodo = {
-                'periodo': periodo,
-                'cota_inicial': cota_inicial,
-                'cota_final': cota_final,
-                'vazao_afluente_m3_s': vazao_afluente,
-                'vazao_turbinada_m3_s': vazao_turbinada,
-                'vazao_demandas_m3_s': vazao_retirada,
-                'precipitacao_mm': precipitacao,
-                'evaporacao_mm': evaporacao,
-                'area_lago_km2': area_corresp_final,
-                'volume_afluente_hm3': volume_afluente,
-                'volume_turbinado_hm3': volume_turbinado,
-                'volume_inicial_hm3': volume_inicial,
-                'volume_final_hm3':  volume_final,
-                'volume_vertido_hm3': volume_vertido,
-                'volume_evaporado_hm3': volume_evap_lago,
-                'volume_precipitado_hm3': volume_prec_lago
-            }    
-            
-        elif volume_minimo < volume_final <= volume_maximo:
-            volume_vertido = 0
-            dados_evapo = calc_evp(
-                    reservatorio=reservatorio, 
-                    volume_inicial=volume_inicial,
-                    row=row,
-                    factor_q_to_vol=factor_q_to_vol
-                )
-            
-            cota_final = dados_evapo['cota_final']
-            area_lago = dados_evapo['area_lago_km2']
-            volume_evap_lago = dados_evapo['volume_evaporado_hm3']
-            volume_prec_lago = dados_evapo['volume_precipitado_hm3']
-
-            volume_final = volume_inicial + volume_afluente - volume_evap_lago + volume_prec_lago\
-                - volume_retirada - volume_turbinado 
-                
-            bal_hidrico_periodo: ResultadoBHNoPeriodo = {
-                'periodo': periodo,
-                'cota_inicial': cota_inicial,
-                'cota_final': cota_final,
-                'vazao_afluente_m3_s': vazao_afluente,
-                'vazao_turbinada_m3_s': vazao_turbinada,
-                'vazao_demandas_m3_s': vazao_retirada,
-                'evaporacao_mm': evaporacao,
-                'precipitacao_mm': precipitacao,
-                'area_lago_km2': area_lago,
-                'volume_afluente_hm3': volume_afluente,
-                'volume_turbinado_hm3': volume_turbinado,
-                'volume_inicial_hm3': volume_inicial,
-                'volume_final_hm3': volume_final,
-                'volume_vertido_hm3': volume_vertido,
-                'volume_evaporado_hm3': volume_evap_lago,
-                'volume_precipitado_hm3': volume_prec_lago
-            }
-
-        resultado.append(bal_hidrico_periodo)
-        volume_inicial = volume_final
-        cota_inicial = cota_final
+    return _monta_resultados(df_serie.index, valores, saida)
+
+
+def _monta_resultados(indice: pd.Index, valores: ValoresSerieTemporal, saida: NDArray) -> list[ResultadoBHNoPeriodo]:
+    resultado: list[ResultadoBHNoPeriodo] = []
+    for periodo, vazao_afluente, precipitacao, evaporacao, (
+        cota_inicial, cota_final, vazao_turbinada, vazao_retirada, area_lago, volume_afluente,
+        volume_turbinado, volume_inicial, volume_final, volume_vertido, volume_evap_lago, volume_prec_lago
+    ) in zip(
+        indice, valores.vazao_afluente.tolist(), valores.precipitacao.tolist(), valores.evaporacao.tolist(),
+        saida.tolist()
+    ):
+        resultado.append({
+            'periodo': periodo,
+            'cota_inicial': cota_inicial,
+            'cota_final': cota_final,
+            'vazao_afluente_m3_s': vazao_afluente,
+            'vazao_turbinada_m3_s': vazao_turbinada,
+            'vazao_demandas_m3_s': vazao_retirada,
+            'precipitacao_mm': precipitacao,
+            'evaporacao_mm': evaporacao,
+            'area_lago_km2': area_lago,
+            'volume_afluente_hm3': volume_afluente,
+            'volume_turbinado_hm3': volume_turbinado,
+            'volume_inicial_hm3': volume_inicial,
+            'volume_final_hm3':  volume_final,
+            'volume_vertido_hm3': volume_vertido,
+            'volume_evaporado_hm3': volume_evap_lago,
+            'volume_precipitado_hm3': volume_prec_lago
+        })
     return resultado
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypedDict
+
+from balanco_hidrico_reservatorios.balanco_hidrico import (
+    PrioridadeDeAtendimento,
+    ResultadoBHNoPeriodo,
+    _calcula_balanco_hidrico_a_partir_do_volume,
+    _prepara_balanco_hidrico,
+)
+from balanco_hidrico_reservatorios.nucleo import Backend
+from balanco_hidrico_reservatorios.reservatorios import Reservatorio
+from balanco_hidrico_reservatorios.serie_temporal import (
+    FREQUENCIAS_PANDAS,
+    SerieTemporal,
+    SerieTemporalInvalida,
+    _checa_falhas_nas_datas_da_serie_temporal,
+    _checa_indice_da_serie_temporal,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+PeriodoCritico = tuple['pd.Period', 'pd.Period']
+
+
+class ResultadoBHMultirresolucao(TypedDict):
+    mensal: list[ResultadoBHNoPeriodo]
+    refinado: list[list[ResultadoBHNoPeriodo]]
+    periodos_criticos: list[PeriodoCritico]
+
+
+def agrega_serie_temporal_mensal(serie_temporal: SerieTemporal) -> SerieTemporal:
+    """Agrega uma série horária ou diária, com meses completos, em uma série mensal:
+    vazões pela média e lâminas de evaporação e precipitação pela soma."""
+
+    import pandas as pd
+
+    df_serie = serie_temporal.dataframe
+    freq = serie_temporal.freq
+    nome_das_colunas = serie_temporal.nome_das_colunas
+
+    if freq not in ('H', 'D'):
+        raise SerieTemporalInvalida(
+            f"Somente séries horárias ou diárias podem ser agregadas em meses -> frequência atual: {freq}"
+        )
+
+    _checa_indice_da_serie_temporal(df_serie, freq=freq)
+    _checa_falhas_nas_datas_da_serie_temporal(df_serie, freq=freq)
+    valores = serie_temporal.valores
+
+    indice = df_serie.index
+    passo = pd.tseries.frequencies.to_offset(FREQUENCIAS_PANDAS[freq])
+    if indice[0] != indice[0].to_period('M').start_time or (indice[-1] + passo).month == indice[-1].month:
+        raise SerieTemporalInvalida(
+            "A série temporal a ser agregada deve começar no início e terminar no fim de um mês -> "
+            f"início: {indice[0]} - fim: {indice[-1]}"
+        )
+
+    meses = indice.to_period('M')  # type: ignore
+    df_vazoes = pd.DataFrame(
+        {
+            nome_das_colunas['vazao_afluente']: valores.vazao_afluente,
+            nome_das_colunas['vazao_turbinada']: valores.vazao_turbinada,
+            nome_das_colunas['vazao_retirada']: valores.vazao_retirada
+        },
+        index=indice
+    )
+    df_laminas = pd.DataFrame(
+        {
+            nome_das_colunas['evaporacao']: valores.evaporacao,
+            nome_das_colunas['precipitacao']: valores.precipitacao
+        },
+        index=indice
+    )
+
+    df_mensal = pd.concat([df_vazoes.groupby(meses).mean(), df_laminas.groupby(meses).sum()], axis=1)
+
+    return SerieTemporal(dataframe=df_mensal, nome_das_colunas=nome_das_colunas, freq='M')
+
+
+def localiza_periodos_criticos(
+    reservatorio: Reservatorio,
+    balanco_mensal: list[ResultadoBHNoPeriodo],
+    margem_critica: float = 0.1
+) -> list[PeriodoCritico]:
+    """Agrupa, em períodos contínuos, os meses cujo volume se aproxima do volume mínimo ou do
+    volume máximo do reservatório, dentro de uma margem dada como fração do volume útil."""
+
+    if margem_critica < 0 or margem_critica > 1:
+        raise ValueError("Margem crítica deve estar entre 0 e 1")
+
+    volume_maximo = reservatorio.volume.maximo
+    volume_minimo = reservatorio.volume.minimo
+    margem = (volume_maximo - volume_minimo) * margem_critica
+
+    periodos_criticos: list[PeriodoCritico] = []
+    inicio: pd.Period | None = None
+    fim: pd.Period | None = None
+    for resultado_mes in balanco_mensal:
+        volumes = (resultado_mes['volume_inicial_hm3'], resultado_mes['volume_final_hm3'])
+        critico = min(volumes) <= volume_minimo + margem or max(volumes) >= volume_maximo - margem \
+            or resultado_mes['volume_vertido_hm3'] > 0
+
+        if critico:
+            inicio = resultado_mes['periodo'] if inicio is None else inicio
+            fim = resultado_mes['periodo']
+        elif inicio is not None:
+            periodos_criticos.append((inicio, fim))  # type: ignore
+            inicio = None
+
+    if inicio is not None:
+        periodos_criticos.append((inicio, fim))  # type: ignore
+
+    return periodos_criticos
+
+
+def calcula_balanco_hidrico_multirresolucao(
+    reservatorio: Reservatorio,
+    serie_temporal: SerieTemporal | None,
+    percentual_volume_inicial: int,
+    prioridade_de_atendimento: PrioridadeDeAtendimento,
+    margem_critica: float = 0.1,
+    backend: Backend = 'python'
+) -> ResultadoBHMultirresolucao:
+    """Executa o balanço hídrico mensal da série agregada e refina, na resolução da série
+    original, somente os períodos críticos.
+
+    Cada período crítico é refinado a partir do volume inicial do seu primeiro mês e o balanço
+    mensal continua a partir do volume final do período refinado, de modo que 'mensal' (meses
+    fora dos períodos críticos) e 'refinado' (um balanço por período crítico, na ordem de
+    'periodos_criticos'), intercalados no tempo, formam uma única trajetória do volume."""
+
+    serie_temporal, volume_inicial = _prepara_balanco_hidrico(reservatorio, serie_temporal, percentual_volume_inicial)
+    serie_mensal = agrega_serie_temporal_mensal(serie_temporal)
+    meses = serie_mensal.dataframe.index
+
+    balanco_mensal: list[ResultadoBHNoPeriodo] = []
+    refinado: list[list[ResultadoBHNoPeriodo]] = []
+    periodos_criticos: list[PeriodoCritico] = []
+    proximo_mes = 0
+    volume = volume_inicial
+    while proximo_mes < len(meses):
+        balanco_restante = _calcula_balanco_hidrico_a_partir_do_volume(
+            reservatorio=reservatorio,
+            serie_temporal=serie_mensal.recorta(meses[proximo_mes], meses[-1]),
+            volume_inicial=volume,
+            prioridade_de_atendimento=prioridade_de_atendimento,
+            backend=backend
+        )
+        criticos = localiza_periodos_criticos(
+            reservatorio=reservatorio,
+            balanco_mensal=balanco_restante,
+            margem_critica=margem_critica
+        )
+        if not criticos:
+            balanco_mensal.extend(balanco_restante)
+            break
+
+        inicio, fim = criticos[0]
+        pos_inicio = meses.get_loc(inicio) - proximo_mes
+        balanco_mensal.extend(balanco_restante[:pos_inicio])
+
+        balanco_refinado = _calcula_balanco_hidrico_a_partir_do_volume(
+            reservatorio=reservatorio,
+            serie_temporal=serie_temporal.recorta(inicio.start_time, fim.end_time),
+            volume_inicial=balanco_restante[pos_inicio]['volume_inicial_hm3'],
+            prioridade_de_atendimento=prioridade_de_atendimento,
+            backend=backend
+        )
+        refinado.append(balanco_refinado)
+        periodos_criticos.append((inicio, fim))
+        proximo_mes = meses.get_loc(fim) + 1
+        volume = balanco_refinado[-1]['volume_final_hm3']
+
+    return {
+        'mensal': balanco_mensal,
+        'refinado': refinado,
+        'periodos_criticos': periodos_criticos
+    }
@@ -0,0 +1,153 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from numpy.typing import NDArray
+
+from balanco_hidrico_reservatorios.balanco_hidrico import (
+    PrioridadeDeAtendimento,
+    ResultadoBHNoPeriodo,
+    _calcula_balanco_hidrico_a_partir_do_volume,
+    _monta_resultados,
+    _prepara_balanco_hidrico,
+)
+from balanco_hidrico_reservatorios.calendario import calcula_fatores_q_para_vol
+from balanco_hidrico_reservatorios.nucleo import (
+    COLUNAS_DO_NUCLEO,
+    Backend,
+    TabelaCav,
+    calcula_balanco_hidrico_em_arrays,
+)
+from balanco_hidrico_reservatorios.reservatorios import Reservatorio
+from balanco_hidrico_reservatorios.serie_temporal import SerieTemporal
+
+_VOLUME_FINAL = COLUNAS_DO_NUCLEO.index('volume_final_hm3')
+
+
+def _simula_trecho(
+    volume_inicial: float,
+    volume_minimo: float,
+    volume_maximo: float,
+    prioridade_de_atendimento: PrioridadeDeAtendimento,
+    entradas: tuple[NDArray, ...],
+    tabela_cav: TabelaCav,
+    backend: Backend
+) -> NDArray:
+    return calcula_balanco_hidrico_em_arrays(
+        volume_inicial, volume_minimo, volume_maximo, prioridade_de_atendimento, *entradas,
+        tabela_cav=tabela_cav, backend=backend
+    )
+
+
+def _simula_limites_do_trecho(
+    volume_minimo: float,
+    volume_maximo: float,
+    prioridade_de_atendimento: PrioridadeDeAtendimento,
+    entradas: tuple[NDArray, ...],
+    tabela_cav: TabelaCav,
+    backend: Backend
+) -> tuple[int, NDArray]:
+    """Simula o trecho a partir dos volumes mínimo e máximo e retorna o primeiro passo em que as
+    duas trajetórias atingem exatamente o mesmo volume final (ponto de reinício) e as linhas da
+    simulação a partir desse passo, inclusive. Retorna -1 se os limites não convergem no trecho."""
+
+    saida_do_minimo = _simula_trecho(
+        volume_minimo, volume_minimo, volume_maximo, prioridade_de_atendimento, entradas, tabela_cav, backend
+    )
+    saida_do_maximo = _simula_trecho(
+        volume_maximo, volume_minimo, volume_maximo, prioridade_de_atendimento, entradas, tabela_cav, backend
+    )
+    convergencias = np.flatnonzero(saida_do_minimo[:, _VOLUME_FINAL] == saida_do_maximo[:, _VOLUME_FINAL])
+    if not convergencias.size:
+        return -1, saida_do_minimo[:0]
+    ponto_de_reinicio = int(convergencias[0])
+    return ponto_de_reinicio, saida_do_minimo[ponto_de_reinicio:]
+
+
+def _divide_em_trechos(num_passos: int, num_trechos: int) -> list[tuple[int, int]]:
+    limites = np.linspace(0, num_passos, num_trechos + 1).astype(int)
+    return [(int(inicio), int(fim)) for inicio, fim in zip(limites[:-1], limites[1:]) if fim > inicio]
+
+
+def calcula_balanco_hidrico_paralelo_no_tempo(
+    reservatorio: Reservatorio,
+    serie_temporal: SerieTemporal | None,
+    percentual_volume_inicial: int,
+    prioridade_de_atendimento: PrioridadeDeAtendimento,
+    num_processos: int | None = None,
+    num_trechos: int | None = None,
+    backend: Backend = 'python'
+) -> list[ResultadoBHNoPeriodo]:
+    """Balanço hídrico de séries longas dividido no tempo entre processos, com resultado idêntico
+    ao de calcula_balanco_hidrico.
+
+    A série é dividida em trechos e cada trecho é simulado, em paralelo, a partir dos volumes
+    mínimo e máximo. Quando as duas trajetórias se encontram (vertimento ou volume mínimo
+    atingidos a partir de qualquer estado inicial), o restante do trecho independe do volume
+    inicial. Na junção, apenas os passos até esse ponto de reinício são simulados a partir do
+    volume real; se o volume real não coincidir com o ponto de reinício, ou se os limites não
+    convergirem no trecho, o trecho é simulado sequencialmente. Com um único processo ou um único
+    trecho, o balanço é executado sequencialmente, sem pool de processos."""
+
+    serie_temporal, volume_inicial = _prepara_balanco_hidrico(reservatorio, serie_temporal, percentual_volume_inicial)
+    df_serie = serie_temporal.dataframe
+    num_processos = num_processos or os.cpu_count() or 1
+    trechos = _divide_em_trechos(len(df_serie.index), num_trechos or num_processos)
+
+    if num_processos == 1 or len(trechos) <= 1:
+        return _calcula_balanco_hidrico_a_partir_do_volume(
+            reservatorio=reservatorio,
+            serie_temporal=serie_temporal,
+            volume_inicial=volume_inicial,
+            prioridade_de_atendimento=prioridade_de_atendimento,
+            backend=backend
+        )
+
+    valores = serie_temporal.valores
+    volume_maximo = reservatorio.volume.maximo
+    volume_minimo = reservatorio.volume.minimo
+    tabela_cav = reservatorio.cav.tabela()
+    entradas = (
+        valores.vazao_afluente, valores.vazao_turbinada, valores.vazao_retirada, valores.evaporacao,
+        valores.precipitacao, calcula_fatores_q_para_vol(df_serie.index, freq=serie_temporal.freq)
+    )
+
+    def entradas_do_trecho(inicio: int, fim: int) -> tuple[NDArray, ...]:
+        return tuple(entrada[inicio:fim] for entrada in entradas)
+
+    with ProcessPoolExecutor(max_workers=num_processos) as executor:
+        futuros = [
+            executor.submit(
+                _simula_limites_do_trecho, volume_minimo, volume_maximo, prioridade_de_atendimento,
+                entradas_do_trecho(inicio, fim), tabela_cav, backend
+            )
+            for inicio, fim in trechos[1:]
+        ]
+        partes: list[NDArray] = []
+        volume = volume_inicial
+        for i, (inicio, fim) in enumerate(trechos):
+            if i > 0:
+                ponto_de_reinicio, saida_apos_reinicio = futuros[i - 1].result()
+                if ponto_de_reinicio >= 0:
+                    prefixo = _simula_trecho(
+                        volume, volume_minimo, volume_maximo, prioridade_de_atendimento,
+                        entradas_do_trecho(inicio, inicio + ponto_de_reinicio + 1), tabela_cav, backend
+                    )
+                    partes.append(prefixo)
+                    if prefixo[-1, _VOLUME_FINAL] == saida_apos_reinicio[0, _VOLUME_FINAL]:
+                        partes.append(saida_apos_reinicio[1:])
+                        volume = saida_apos_reinicio[-1, _VOLUME_FINAL]
+                        continue
+                    inicio = inicio + ponto_de_reinicio + 1
+                    volume = prefixo[-1, _VOLUME_FINAL]
+
+            if fim > inicio:
+                saida_do_trecho = _simula_trecho(
+                    volume, volume_minimo, volume_maximo, prioridade_de_atendimento,
+                    entradas_do_trecho(inicio, fim), tabela_cav, backend
+                )
+                partes.append(saida_do_trecho)
+                volume = saida_do_trecho[-1, _VOLUME_FINAL]
+
+    saida = np.concatenate(partes)
+    return _monta_resultados(df_serie.index, valores, saida)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from balanco_hidrico_reservatorios.serie_temporal import Frequencia
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+FATOR_Q_PARA_VOL_DIARIO = 0.086400
+
+DURACAO_DO_PASSO_EM_DIAS: dict[str, float] = {
+    'H': 1 / 24,
+    'D': 1.0,
+    'W': 7.0
+}
+
+
+@lru_cache(maxsize=128)
+def _calcula_duracao_dos_passos_em_dias(freq: Frequencia, ano: int, mes: int, num_passos: int) -> NDArray:
+    if freq == 'M':
+        mes_inicial = np.datetime64(f"{ano:04d}-{mes:02d}", 'M')
+        meses = np.arange(mes_inicial, mes_inicial + num_passos + 1)
+        duracao = np.diff(meses.astype('datetime64[D]')).astype(np.float64)
+    else:
+        duracao = np.full(num_passos, DURACAO_DO_PASSO_EM_DIAS[freq])
+    duracao.setflags(write=False)
+    return duracao
+
+
+@lru_cache(maxsize=128)
+def _calcula_fatores_q_para_vol(freq: Frequencia, ano: int, mes: int, num_passos: int) -> NDArray:
+    fatores = FATOR_Q_PARA_VOL_DIARIO * _calcula_duracao_dos_passos_em_dias(freq, ano, mes, num_passos)
+    fatores.setflags(write=False)
+    return fatores
+
+
+def _chave_do_indice(indice: pd.Index, freq: Frequencia) -> tuple[Frequencia, int, int, int]:
+    if freq == 'M' and len(indice) > 0:
+        return freq, indice[0].year, indice[0].month, len(indice)
+    return freq, 0, 0, len(indice)
+
+
+def calcula_duracao_dos_passos_em_dias(indice: pd.Index, freq: Frequencia) -> NDArray:
+    """Retorna a duração, em dias, de cada passo do índice (sem falhas) da série temporal."""
+    return _calcula_duracao_dos_passos_em_dias(*_chave_do_indice(indice, freq))
+
+
+def calcula_fatores_q_para_vol(indice: pd.Index, freq: Frequencia) -> NDArray:
+    """Retorna o fator de conversão de vazão (m³/s) para volume (hm³) de cada passo do índice
+    (sem falhas) da série temporal."""
+    return _calcula_fatores_q_para_vol(*_chave_do_indice(indice, freq))
+
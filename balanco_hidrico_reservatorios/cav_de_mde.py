@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import NDArray
+
+from balanco_hidrico_reservatorios.cavs import ParametrosPolinomiosONS
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+LINHAS_POR_BLOCO = 1024
+
+
+def _abre_matriz(matriz: NDArray | str | Path) -> NDArray:
+    if isinstance(matriz, (str, Path)):
+        return np.load(matriz, mmap_mode='r')
+    return np.asarray(matriz)
+
+
+def calcula_cav_de_mde(
+    elevacoes: NDArray | str | Path,
+    tamanho_da_celula_m: float,
+    mascara: NDArray | str | Path,
+    cotas: NDArray,
+    linhas_por_bloco: int = LINHAS_POR_BLOCO
+) -> pd.DataFrame:
+    """Calcula a curva Cota-Área-Volume de um reservatório a partir de um modelo digital de elevação.
+
+    'elevacoes' é uma matriz 2-D de cotas do terreno (m) e 'mascara' uma matriz booleana de mesmo
+    formato com as células da área de inundação do barramento; ambas podem ser arquivos .npy, lidos
+    com memory-map. O MDE é processado em blocos de linhas: as cotas de cada bloco são ordenadas e,
+    com somas acumuladas, são obtidos para todas as 'cotas' o número de células inundadas e a soma
+    das suas elevações. Células com elevação NaN são ignoradas.
+
+    Retorna um DataFrame com as colunas 'cota_m', 'area_km2' e 'volume_hm3', compatível com
+    CavReservatorio(df, 'cota_m', 'area_km2', 'volume_hm3')."""
+
+    import pandas as pd
+
+    elevacoes = _abre_matriz(elevacoes)
+    mascara = _abre_matriz(mascara)
+    cotas = np.asarray(cotas, dtype=np.float64)
+
+    if elevacoes.ndim != 2 or elevacoes.shape != mascara.shape:
+        raise ValueError(
+            "O MDE e a máscara devem ser matrizes 2-D de mesmo formato -> "
+            f"MDE: {elevacoes.shape} - máscara: {mascara.shape}"
+        )
+    if tamanho_da_celula_m <= 0:
+        raise ValueError("Tamanho da célula deve ser maior que zero")
+    if linhas_por_bloco < 1:
+        raise ValueError("Número de linhas por bloco deve ser maior ou igual a 1")
+    if np.any(np.diff(cotas) <= 0):
+        raise ValueError("As cotas devem estar em ordem estritamente crescente")
+
+    celulas_inundadas = np.zeros(cotas.size, dtype=np.int64)
+    soma_das_elevacoes = np.zeros(cotas.size, dtype=np.float64)
+
+    for inicio in range(0, elevacoes.shape[0], linhas_por_bloco):
+        bloco = np.asarray(elevacoes[inicio:inicio + linhas_por_bloco], dtype=np.float64)
+        elevacoes_do_bloco = bloco[np.asarray(mascara[inicio:inicio + linhas_por_bloco], dtype=bool)]
+        elevacoes_do_bloco = np.sort(elevacoes_do_bloco[~np.isnan(elevacoes_do_bloco)])
+
+        num_abaixo = np.searchsorted(elevacoes_do_bloco, cotas, side='right')
+        somas_acumuladas = np.concatenate([[0.0], np.cumsum(elevacoes_do_bloco)])
+        celulas_inundadas += num_abaixo
+        soma_das_elevacoes += somas_acumuladas[num_abaixo]
+
+    area_da_celula_km2 = tamanho_da_celula_m ** 2 / 1e6
+
+    return pd.DataFrame({
+        'cota_m': cotas,
+        'area_km2': celulas_inundadas * area_da_celula_km2,
+        'volume_hm3': (celulas_inundadas * cotas - soma_das_elevacoes) * area_da_celula_km2
+    })
+
+
+def ajusta_polinomio_area_cota(cotas: NDArray, areas: NDArray) -> ParametrosPolinomiosONS:
+    """Ajusta, por mínimos quadrados, o polinômio de 4º grau da área (km²) em função da cota (m)
+    utilizado por CavReservatorioONS (area = a + b*cota + c*cota² + d*cota³ + e*cota⁴)."""
+
+    coeficientes = np.polynomial.Polynomial.fit(
+        np.asarray(cotas, dtype=np.float64), np.asarray(areas, dtype=np.float64), 4
+    ).convert().coef
+    coeficientes = np.pad(coeficientes, (0, 5 - coeficientes.size))
+
+    return ParametrosPolinomiosONS(**{
+        nome: float(coeficiente) for nome, coeficiente in zip(('a', 'b', 'c', 'd', 'e'), coeficientes)
+    })
@@ -1,10 +1,15 @@
-from typing import Protocol, TypedDict
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol, TypedDict
 
 import numpy as np
-import pandas as pd
 from numpy.typing import NDArray
 
 from balanco_hidrico_reservatorios.conversor import _calcula_interpolacao_por_variaveis
+from balanco_hidrico_reservatorios.nucleo import TabelaCav
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class DataFrameCavInvalidoErro(Exception):
     def __init__(self, mensagem: str) -> None:
@@ -60,6 +65,9 @@ class CAV(Protocol):
     def calcula_cotas_por(self, *, volumes: NDArray) -> NDArray:
         ...
 
+    def tabela(self) -> TabelaCav:
+        ...
+
 
 class CavReservatorio:
     """Classe que representa a Curva Cota-Área-Volume de um Reservatório"""
@@ -69,7 +77,7 @@ class CavReservatorio:
         self.col_cota = col_cota
         self.col_area = col_area
         self.col_vol = col_vol
-        self.cav = cav.copy().sort_values(col_cota)
+        self.cav = cav.sort_values(col_cota)
 
     def calcula_area_por(self, cota: float) -> float:
         area = _calcula_interpolacao_por_variaveis(
@@ -123,6 +131,13 @@ class CavReservatorio:
         )
         return cotas
 
+    def tabela(self) -> TabelaCav:
+        return TabelaCav(
+            cotas=self.cav[self.col_cota].to_numpy(dtype=float),
+            areas=self.cav[self.col_area].to_numpy(dtype=float),
+            volumes=self.cav[self.col_vol].to_numpy(dtype=float)
+        )
+
 
 class CurvaCotaVolumeONS:
 
@@ -130,7 +145,7 @@ class CurvaCotaVolumeONS:
         checa_validade_dataframe_da_curva_cota_volume(curva_cota_volume, coluna_cota, coluna_volume)
         self.coluna_cota = coluna_cota
         self.coluna_volume = coluna_volume
-        self.curva_cota_volume = curva_cota_volume.copy().sort_values(coluna_cota)
+        self.curva_cota_volume = curva_cota_volume.sort_values(coluna_cota)
 
     def calcula_volume_por(self, cota: float) -> float:
         volume = _calcula_interpolacao_por_variaveis(
@@ -164,6 +179,14 @@ class CurvaCotaVolumeONS:
             valor=volumes)
         return cotas
 
+    def tabela(self) -> TabelaCav:
+        cotas = self.curva_cota_volume[self.coluna_cota].to_numpy(dtype=float)
+        return TabelaCav(
+            cotas=cotas,
+            areas=np.full(cotas.size, np.nan),
+            volumes=self.curva_cota_volume[self.coluna_volume].to_numpy(dtype=float)
+        )
+
 
 class CavReservatorioONS:
 
@@ -175,6 +198,7 @@ class CavReservatorioONS:
     ) -> None:
         
         self.curva_cota_volume = curva_cota_volume
+        self.params_area_fn_cota = params_area_fn_cota
         self.polinomial_area_fn_cota = self.__retorna_polinomial(params_area_fn_cota)
         # self.polinomial_cota_fn_volume = self.__retorna_polinomial(params_cota_fn_vol)
 
@@ -198,4 +222,13 @@ class CavReservatorioONS:
         return self.curva_cota_volume.calcula_cota_por(volume=volume)
 
     def calcula_cotas_por(self, *, volumes: NDArray) -> NDArray:
-        return self.calcula_cotas_por(volumes=volumes)
\ No newline at end of file
+        return self.calcula_cotas_por(volumes=volumes)
+
+    def tabela(self) -> TabelaCav:
+        tabela_cota_volume = self.curva_cota_volume.tabela()
+        return TabelaCav(
+            cotas=tabela_cota_volume.cotas,
+            areas=tabela_cota_volume.areas,
+            volumes=tabela_cota_volume.volumes,
+            coeficientes_area=np.array([self.params_area_fn_cota[i] for i in ('a', 'b', 'c', 'd', 'e')], dtype=float)
+        )
@@ -0,0 +1,196 @@
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TypedDict
+
+from balanco_hidrico_reservatorios.balanco_hidrico import calcula_balanco_hidrico
+from balanco_hidrico_reservatorios.curva_de_regularização import calcula_curva_de_regularizada
+from balanco_hidrico_reservatorios.especificacao import (
+    EspecificacaoInvalida,
+    EspecificacaoReservatorio,
+    carrega_especificacao,
+    monta_reservatorio,
+)
+from balanco_hidrico_reservatorios.exportacao import EXTENSOES, FormatoDeExportacao, exporta_resultados
+from balanco_hidrico_reservatorios.ingestao import carrega_antecipadamente
+from balanco_hidrico_reservatorios.nucleo import Backend
+from balanco_hidrico_reservatorios.reservatorios import Reservatorio
+
+
+class ResumoDoTrabalho(TypedDict):
+    nome: str
+    tempo_de_leitura_s: float
+    tempo_de_simulacao_s: float
+    arquivos: list[str]
+
+
+def _executa_analises(
+    especificacao: EspecificacaoReservatorio,
+    reservatorio: Reservatorio,
+    diretorio_de_saida: str,
+    formato: FormatoDeExportacao,
+    backend: Backend
+) -> list[str]:
+    diretorio = Path(diretorio_de_saida) / especificacao['nome']
+    arquivos: list[str] = []
+    for analise in especificacao['analises']:
+        if analise == "balanco_hidrico":
+            resultado = calcula_balanco_hidrico(
+                reservatorio=reservatorio,
+                serie_temporal=None,
+                percentual_volume_inicial=especificacao['percentual_volume_inicial'],
+                prioridade_de_atendimento=especificacao['prioridade_de_atendimento'],
+                backend=backend
+            )
+        if analise == "curva_de_regularizacao":
+            resultado = calcula_curva_de_regularizada(
+                reservatorio=reservatorio,
+                serie_temporal=None,
+                percentual_volume_inicial=especificacao['percentual_volume_inicial'],
+                backend=backend
+            )
+        caminho = exporta_resultados(resultado, diretorio / f"{analise}.{formato}", formato=formato)  # type: ignore
+        arquivos.append(str(caminho))
+    return arquivos
+
+
+def _carrega_reservatorio(especificacao: EspecificacaoReservatorio) -> tuple[Reservatorio, float]:
+    inicio = time.perf_counter()
+    reservatorio = monta_reservatorio(especificacao)
+    return reservatorio, time.perf_counter() - inicio
+
+
+def _simula_reservatorio(
+    especificacao: EspecificacaoReservatorio,
+    reservatorio: Reservatorio,
+    tempo_de_leitura: float,
+    diretorio_de_saida: str,
+    formato: FormatoDeExportacao,
+    backend: Backend
+) -> ResumoDoTrabalho:
+    inicio = time.perf_counter()
+    arquivos = _executa_analises(especificacao, reservatorio, diretorio_de_saida, formato, backend)
+
+    return {
+        'nome': especificacao['nome'],
+        'tempo_de_leitura_s': tempo_de_leitura,
+        'tempo_de_simulacao_s': time.perf_counter() - inicio,
+        'arquivos': arquivos
+    }
+
+
+def executa_trabalho(
+    especificacao: EspecificacaoReservatorio,
+    diretorio_de_saida: str,
+    formato: FormatoDeExportacao,
+    backend: Backend
+) -> ResumoDoTrabalho:
+    """Lê as entradas de um reservatório, executa as análises da especificação e grava os resultados."""
+
+    reservatorio, tempo_de_leitura = _carrega_reservatorio(especificacao)
+    return _simula_reservatorio(
+        especificacao, reservatorio, tempo_de_leitura, diretorio_de_saida, formato, backend
+    )
+
+
+def _imprime_progresso(concluidos: int, total: int, resumo: ResumoDoTrabalho) -> None:
+    print(
+        f"[{concluidos}/{total}] {resumo['nome']}: leitura {resumo['tempo_de_leitura_s']:.2f} s - "
+        f"simulação {resumo['tempo_de_simulacao_s']:.2f} s -> {', '.join(resumo['arquivos'])}",
+        flush=True
+    )
+
+
+def _imprime_falha(concluidos: int, total: int, nome: str, erro: Exception) -> None:
+    mensagem = getattr(erro, 'message', None) or str(erro)
+    print(f"[{concluidos}/{total}] {nome}: FALHA - {type(erro).__name__}: {mensagem}", file=sys.stderr, flush=True)
+
+
+def _inteiro_positivo(texto: str) -> int:
+    valor = int(texto)
+    if valor < 1:
+        raise argparse.ArgumentTypeError(f"deve ser um inteiro maior ou igual a 1 -> valor: {texto}")
+    return valor
+
+
+def _cria_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='balanco-hidrico',
+        description="Executa os balanços hídricos descritos em um arquivo de trabalhos (.toml ou .json)."
+    )
+    parser.add_argument('arquivo_de_trabalhos', help="arquivo com a seção [execucao] e a lista [[reservatorios]]")
+    parser.add_argument(
+        '-p', '--processos', type=_inteiro_positivo, help="número de processos (padrão: valor do arquivo ou 1)"
+    )
+    parser.add_argument('-o', '--diretorio-de-saida', help="diretório de saída (padrão: valor do arquivo)")
+    parser.add_argument('-f', '--formato', choices=list(EXTENSOES.values()), help="formato dos arquivos de saída")
+    parser.add_argument('-b', '--backend', choices=['python', 'numba'], help="backend do balanço hídrico")
+    parser.add_argument(
+        '--pre-carregamento', type=_inteiro_positivo,
+        help="reservatórios lidos antecipadamente, em threads, durante a simulação com um único processo"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    argumentos = _cria_parser().parse_args(argv)
+
+    try:
+        especificacao = carrega_especificacao(argumentos.arquivo_de_trabalhos)
+    except EspecificacaoInvalida as erro:
+        print(f"Arquivo de trabalhos inválido: {erro.message}", file=sys.stderr)
+        return 2
+
+    sobrescritas = {
+        chave: valor for chave, valor in vars(argumentos).items()
+        if chave in especificacao['execucao'] and valor is not None
+    }
+    execucao = {**especificacao['execucao'], **sobrescritas}
+    processos = execucao['processos']
+    diretorio_de_saida = execucao['diretorio_de_saida']
+    formato = execucao['formato']
+    backend = execucao['backend']
+    pre_carregamento = execucao['pre_carregamento']
+    reservatorios = especificacao['reservatorios']
+    total = len(reservatorios)
+
+    print(f"Executando {total} reservatório(s) com {processos} processo(s) -> {diretorio_de_saida}", flush=True)
+    inicio = time.perf_counter()
+    falhas = 0
+    concluidos = 0
+
+    if processos > 1:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            futuros = {
+                executor.submit(executa_trabalho, reservatorio, diretorio_de_saida, formato, backend): reservatorio['nome']
+                for reservatorio in reservatorios
+            }
+            for futuro in as_completed(futuros):
+                concluidos += 1
+                try:
+                    _imprime_progresso(concluidos, total, futuro.result())
+                except Exception as erro:
+                    falhas += 1
+                    _imprime_falha(concluidos, total, futuros[futuro], erro)
+    else:
+        for especificacao_reservatorio, carregamento in carrega_antecipadamente(
+            reservatorios, _carrega_reservatorio, profundidade=pre_carregamento
+        ):
+            concluidos += 1
+            try:
+                reservatorio, tempo_de_leitura = carregamento.result()
+                _imprime_progresso(concluidos, total, _simula_reservatorio(
+                    especificacao_reservatorio, reservatorio, tempo_de_leitura, diretorio_de_saida, formato, backend
+                ))
+            except Exception as erro:
+                falhas += 1
+                _imprime_falha(concluidos, total, especificacao_reservatorio['nome'], erro)
+
+    print(f"Concluído em {time.perf_counter() - inicio:.2f} s - {total - falhas} sucesso(s), {falhas} falha(s)")
+    return 1 if falhas else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
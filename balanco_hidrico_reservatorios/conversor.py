@@ -1,7 +1,15 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import numpy as np
-import pandas as pd
 from numpy.typing import NDArray
 
+from balanco_hidrico_reservatorios.nucleo import interpola_em_arrays
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def converte_para(variable_volume_curve: pd.DataFrame, variable: float, variable_name="cota") -> float:
 
@@ -43,20 +51,8 @@ def _calcula_interpolacao_por_variaveis(
     valor: NDArray
 ) -> NDArray:
 
-    arr_variable = dados_cav[coluna_dados_ref].to_numpy()
-    arr_target = dados_cav[coluna_dados_interp].to_numpy()
-
-    idx = np.searchsorted(arr_variable, valor)
-    idx_corrigido = np.where(idx < arr_target.size - 1, idx, arr_target.size - 1)
-    idx_esq = np.where(idx_corrigido < arr_target.size - 1, idx_corrigido, idx_corrigido - 1)
-    idx_dir = np.where(idx_corrigido < arr_target.size - 2, idx_corrigido + 1, arr_target.size - 1)
-
-    variavel_esq = arr_variable[idx_esq]
-    variavel_dir = arr_variable[idx_dir]
-    valor_esq = arr_target[idx_esq]
-    valor_dir = arr_target[idx_dir]
-
-    valor_resultante = valor_dir - (variavel_dir - valor) * \
-        (valor_dir - valor_esq) / (variavel_dir - variavel_esq)
-
-    return valor_resultante
\ No newline at end of file
+    return interpola_em_arrays(
+        referencia=dados_cav[coluna_dados_ref].to_numpy(),
+        alvo=dados_cav[coluna_dados_interp].to_numpy(),
+        valores=valor
+    )
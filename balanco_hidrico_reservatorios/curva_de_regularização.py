@@ -1,9 +1,9 @@
 from typing import TypedDict
 
 import numpy as np
-import pandas as pd
 
 from balanco_hidrico_reservatorios.balanco_hidrico import calcula_balanco_hidrico
+from balanco_hidrico_reservatorios.nucleo import Backend
 from balanco_hidrico_reservatorios.reservatorios import Reservatorio
 from balanco_hidrico_reservatorios.serie_temporal import SerieTemporal
 
@@ -17,25 +17,19 @@ def gera_curva_de_regularizacao(
     serie_temporal: SerieTemporal,
     faixa_de_vazoes: tuple[float, float],
     percentual_volume_inicial: int = 50,
+    backend: Backend = 'python'
 ) -> list[Regularizacao]:
     
-    nome_das_colunas = serie_temporal.nome_das_colunas
-    df_serie = serie_temporal.dataframe
-    df_serie[nome_das_colunas['vazao_turbinada']] = 0
+    serie_sem_turbinamento = serie_temporal.com_substituicoes(vazao_turbinada=0.0)
     
     curva_de_regularizacao: list[Regularizacao] = []
     for vazao in np.linspace(start=faixa_de_vazoes[0], stop=faixa_de_vazoes[1], num=100)[::-1]:
-        df_serie[nome_das_colunas['vazao_retirada']] = vazao
-        
         balanco_hidrico = calcula_balanco_hidrico(
             reservatorio=reservatorio,
-            serie_temporal=SerieTemporal(
-                dataframe=df_serie,
-                nome_das_colunas=nome_das_colunas, 
-                freq=serie_temporal.freq
-            ),
+            serie_temporal=serie_sem_turbinamento.com_substituicoes(vazao_retirada=vazao),
             percentual_volume_inicial=percentual_volume_inicial,
-            prioridade_de_atendimento='Vazão das Demandas'
+            prioridade_de_atendimento='Vazão das Demandas',
+            backend=backend
         )
         
         percentual_atendido = np.sum(
@@ -70,6 +64,7 @@ def calcula_curva_de_regularizada(
     reservatorio: Reservatorio,
     serie_temporal: SerieTemporal | None,
     percentual_volume_inicial: int = 50,
+    backend: Backend = 'python'
 ) -> list[Regularizacao]:
     
     percentuais_de_atendimento = list(range(1, 100))
@@ -77,15 +72,14 @@ def calcula_curva_de_regularizada(
     if serie_temporal is None:
         serie_temporal = reservatorio.serie_temporal
     
-    nome_das_colunas = serie_temporal.nome_das_colunas
-    df_serie = serie_temporal.dataframe
-    vazao_media = df_serie[nome_das_colunas['vazao_afluente']].mean()
+    vazao_media = np.nanmean(serie_temporal.valores.vazao_afluente)
 
     curva_reg_inicial = gera_curva_de_regularizacao(
         reservatorio=reservatorio,
         serie_temporal=serie_temporal,
         faixa_de_vazoes=(0, vazao_media * 5),
-        percentual_volume_inicial=percentual_volume_inicial
+        percentual_volume_inicial=percentual_volume_inicial,
+        backend=backend
     )
     
     curva_de_regularizacao: list[Regularizacao] = []
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import json
+import tomllib
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, NotRequired, TypedDict, get_args
+
+from balanco_hidrico_reservatorios.cavs import (
+    CavReservatorio,
+    CavReservatorioONS,
+    CurvaCotaVolumeONS,
+    ParametrosPolinomiosONS,
+)
+from balanco_hidrico_reservatorios.exportacao import FormatoDeExportacao
+from balanco_hidrico_reservatorios.nucleo import Backend, PrioridadeDeAtendimento
+from balanco_hidrico_reservatorios.reservatorios import (
+    PropsCota,
+    PropsVolume,
+    Reservatorio,
+    ReservatorioONS,
+    ReservatorioSAR,
+)
+from balanco_hidrico_reservatorios.serie_temporal import ColunasSerieTemporal, Frequencia, SerieTemporal
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+Analise = Literal["balanco_hidrico", "curva_de_regularizacao"]
+
+
+class EspecificacaoInvalida(Exception):
+    def __init__(self, message):
+        self.message = message
+
+
+class EspecificacaoCav(TypedDict):
+    arquivo: str
+    coluna_cota: str
+    coluna_volume: str
+    coluna_area: NotRequired[str]
+    polinomio_area: NotRequired[ParametrosPolinomiosONS]
+
+
+class EspecificacaoSerieTemporal(TypedDict):
+    arquivo: str
+    coluna_data: str
+    freq: Frequencia
+    colunas: ColunasSerieTemporal
+
+
+class EspecificacaoReservatorio(TypedDict):
+    nome: str
+    volume: dict[str, float]
+    cota: dict[str, float]
+    cav: EspecificacaoCav
+    serie_temporal: EspecificacaoSerieTemporal
+    percentual_volume_inicial: int
+    prioridade_de_atendimento: PrioridadeDeAtendimento
+    analises: list[Analise]
+
+
+class EspecificacaoExecucao(TypedDict):
+    diretorio_de_saida: str
+    formato: FormatoDeExportacao
+    processos: int
+    pre_carregamento: int
+    backend: Backend
+
+
+class EspecificacaoTrabalhos(TypedDict):
+    execucao: EspecificacaoExecucao
+    reservatorios: list[EspecificacaoReservatorio]
+
+
+ANALISES: tuple[Analise, ...] = ("balanco_hidrico", "curva_de_regularizacao")
+
+EXECUCAO_PADRAO: EspecificacaoExecucao = {
+    'diretorio_de_saida': 'saida',
+    'formato': 'csv',
+    'processos': 1,
+    'pre_carregamento': 2,
+    'backend': 'python'
+}
+
+
+def _resolve_caminho(caminho: str, diretorio_base: Path) -> Path:
+    caminho_resolvido = Path(caminho)
+    return caminho_resolvido if caminho_resolvido.is_absolute() else diretorio_base / caminho_resolvido
+
+
+def carrega_especificacao(caminho: str | Path) -> EspecificacaoTrabalhos:
+    """Lê um arquivo de trabalhos em TOML ou JSON. Caminhos relativos de arquivos de entrada e do
+    diretório de saída são resolvidos a partir do diretório do arquivo de trabalhos."""
+
+    caminho = Path(caminho)
+    if caminho.suffix not in ('.toml', '.json'):
+        raise EspecificacaoInvalida(f"Arquivo de trabalhos deve ser .toml ou .json -> arquivo: {caminho}")
+
+    try:
+        if caminho.suffix == '.toml':
+            with open(caminho, 'rb') as arquivo:
+                dados = tomllib.load(arquivo)
+        else:
+            with open(caminho, encoding='utf-8') as arquivo:
+                dados = json.load(arquivo)
+    except (OSError, tomllib.TOMLDecodeError, json.JSONDecodeError) as erro:
+        raise EspecificacaoInvalida(f"Não foi possível ler o arquivo de trabalhos '{caminho}': {erro}") from erro
+
+    reservatorios = dados.get('reservatorios')
+    if not reservatorios:
+        raise EspecificacaoInvalida("O arquivo de trabalhos não possui nenhum reservatório em 'reservatorios'")
+
+    diretorio_base = caminho.parent
+    execucao: EspecificacaoExecucao = {**EXECUCAO_PADRAO, **dados.get('execucao', {})}  # type: ignore
+    _checa_especificacao_da_execucao(execucao)
+    execucao['diretorio_de_saida'] = str(_resolve_caminho(execucao['diretorio_de_saida'], diretorio_base))
+
+    for reservatorio in reservatorios:
+        _checa_especificacao_do_reservatorio(reservatorio)
+        reservatorio.setdefault('percentual_volume_inicial', 50)
+        reservatorio.setdefault('prioridade_de_atendimento', "Vazão das Demandas")
+        reservatorio.setdefault('analises', ["balanco_hidrico"])
+        reservatorio['cav']['arquivo'] = str(_resolve_caminho(reservatorio['cav']['arquivo'], diretorio_base))
+        reservatorio['serie_temporal']['arquivo'] = str(
+            _resolve_caminho(reservatorio['serie_temporal']['arquivo'], diretorio_base)
+        )
+
+    return {'execucao': execucao, 'reservatorios': reservatorios}
+
+
+def _checa_especificacao_da_execucao(execucao: dict) -> None:
+    if execucao['formato'] not in get_args(FormatoDeExportacao):
+        raise EspecificacaoInvalida(
+            f"Formato '{execucao['formato']}' inválido em 'execucao' -> "
+            f"formatos válidos: {list(get_args(FormatoDeExportacao))}"
+        )
+    if execucao['backend'] not in get_args(Backend):
+        raise EspecificacaoInvalida(
+            f"Backend '{execucao['backend']}' inválido em 'execucao' -> backends válidos: {list(get_args(Backend))}"
+        )
+    for chave in ('processos', 'pre_carregamento'):
+        valor = execucao[chave]
+        if isinstance(valor, bool) or not isinstance(valor, int) or valor < 1:
+            raise EspecificacaoInvalida(f"'{chave}' em 'execucao' deve ser um inteiro maior ou igual a 1 -> valor: {valor}")
+
+
+def _checa_especificacao_do_reservatorio(reservatorio: dict) -> None:
+    nome = reservatorio.get('nome', '<sem nome>')
+    for chave in ('nome', 'volume', 'cota', 'cav', 'serie_temporal'):
+        if chave not in reservatorio:
+            raise EspecificacaoInvalida(f"Reservatório '{nome}' sem a chave obrigatória '{chave}'")
+
+    for analise in reservatorio.get('analises', []):
+        if analise not in ANALISES:
+            raise EspecificacaoInvalida(
+                f"Análise '{analise}' inválida no reservatório '{nome}' -> análises válidas: {list(ANALISES)}"
+            )
+
+    cav = reservatorio['cav']
+    if 'coluna_area' not in cav and 'polinomio_area' not in cav:
+        raise EspecificacaoInvalida(
+            f"A CAV do reservatório '{nome}' deve informar 'coluna_area' ou 'polinomio_area'"
+        )
+
+    prioridade = reservatorio.get('prioridade_de_atendimento', "Vazão das Demandas")
+    if prioridade not in get_args(PrioridadeDeAtendimento):
+        raise EspecificacaoInvalida(
+            f"Prioridade de atendimento '{prioridade}' inválida no reservatório '{nome}' -> "
+            f"prioridades válidas: {list(get_args(PrioridadeDeAtendimento))}"
+        )
+
+    percentual = reservatorio.get('percentual_volume_inicial', 50)
+    if isinstance(percentual, bool) or not isinstance(percentual, (int, float)) or not 0 <= percentual <= 100:
+        raise EspecificacaoInvalida(
+            f"'percentual_volume_inicial' do reservatório '{nome}' deve estar entre 0 e 100 -> valor: {percentual}"
+        )
+
+    freq = reservatorio['serie_temporal'].get('freq')
+    if freq not in get_args(Frequencia):
+        raise EspecificacaoInvalida(
+            f"Frequência '{freq}' inválida na série temporal do reservatório '{nome}' -> "
+            f"frequências válidas: {list(get_args(Frequencia))}"
+        )
+
+
+def _le_tabela(arquivo: str) -> pd.DataFrame:
+    import pandas as pd
+
+    if arquivo.endswith('.parquet'):
+        return pd.read_parquet(arquivo)
+    return pd.read_csv(arquivo)
+
+
+def carrega_cav(especificacao: EspecificacaoCav) -> CavReservatorio | CavReservatorioONS:
+    df_cav = _le_tabela(especificacao['arquivo'])
+
+    if 'polinomio_area' in especificacao:
+        return CavReservatorioONS(
+            params_area_fn_cota=especificacao['polinomio_area'],
+            curva_cota_volume=CurvaCotaVolumeONS(
+                df_cav, especificacao['coluna_cota'], especificacao['coluna_volume']
+            )
+        )
+
+    return CavReservatorio(
+        df_cav, especificacao['coluna_cota'], especificacao['coluna_area'], especificacao['coluna_volume']
+    )
+
+
+def carrega_serie_temporal(especificacao: EspecificacaoSerieTemporal) -> SerieTemporal:
+    import pandas as pd
+
+    df_serie = _le_tabela(especificacao['arquivo'])
+    indice = pd.DatetimeIndex(pd.to_datetime(df_serie.pop(especificacao['coluna_data'])))
+    df_serie.index = indice.to_period('M') if especificacao['freq'] == 'M' else indice
+
+    return SerieTemporal(
+        dataframe=df_serie,
+        nome_das_colunas=especificacao['colunas'],
+        freq=especificacao['freq']
+    )
+
+
+def monta_reservatorio(especificacao: EspecificacaoReservatorio) -> Reservatorio:
+    """Lê os arquivos da CAV e da série temporal e monta o reservatório descrito na especificação."""
+
+    cav = carrega_cav(especificacao['cav'])
+    serie_temporal = carrega_serie_temporal(especificacao['serie_temporal'])
+    volume = PropsVolume(
+        util_total=None,
+        maximo=especificacao['volume']['maximo'],
+        minimo=especificacao['volume']['minimo'],
+        util=None
+    )
+    cota = PropsCota(maxima=especificacao['cota']['maxima'], minima=especificacao['cota']['minima'])
+    atributos = dict(
+        nome=especificacao['nome'],
+        esp_cd=None,
+        cod_sar=None,
+        area_ha=None,
+        latitude=None,
+        longitude=None,
+        volume=volume,
+        cota=cota,
+        serie_temporal=serie_temporal
+    )
+
+    if isinstance(cav, CavReservatorioONS):
+        return ReservatorioONS(**atributos, cav=cav, cod_ons=None, nome_longo=None)
+    return ReservatorioSAR(**atributos, cav=cav, capacidade=None)
@@ -1,11 +1,14 @@
-from calendar import monthrange
-from typing import TypedDict
+from __future__ import annotations
 
-import pandas as pd
+from typing import TYPE_CHECKING, TypedDict
 
+from balanco_hidrico_reservatorios.nucleo import Backend, calcula_evaporacao_do_lago_em_arrays
 from balanco_hidrico_reservatorios.reservatorios import Reservatorio
 from balanco_hidrico_reservatorios.serie_temporal import ColunasSerieTemporal
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class ResultadoEvaporacaoNoPeriodo(TypedDict):
     cota_final: float
@@ -18,7 +21,8 @@ def calcula_volume_evaporado_do_lago(
     reservatorio: Reservatorio,
     volume_inicial: float,
     row: pd.Series,
-    factor_q_to_vol: float
+    factor_q_to_vol: float,
+    backend: Backend = 'python'
 ) -> ResultadoEvaporacaoNoPeriodo:
     
 
@@ -33,22 +37,16 @@ def calcula_volume_evaporado_do_lago(
     volume_turbinado = vazao_turbinada * factor_q_to_vol
     volume_retirada = vazao_retirada * factor_q_to_vol
     
-    cota_inicial = reservatorio.cav.calcula_cota_por(volume=volume_inicial)
-    area_corresp_inicial = reservatorio.cav.calcula_area_por(cota=cota_inicial)
-
-    volume_sem_evap = volume_inicial + volume_afluente - volume_retirada - volume_turbinado
-
-    volume_evap_lago = 0
-    volume_prec_lago = 0
-    diferenca = 99999.0
-    while (diferenca > 0.1):
-        volume_final = volume_sem_evap - volume_evap_lago + volume_prec_lago
-        cota_final = reservatorio.cav.calcula_cota_por(volume=volume_final)
-        area_corresp_final = reservatorio.cav.calcula_area_por(cota=cota_final)
-        area_media = (area_corresp_inicial + area_corresp_final) / 2
-        diferenca = abs((volume_prec_lago - volume_evap_lago) - area_media * (precipitacao - evaporacao) / 1_000)
-        volume_evap_lago = area_media * evaporacao / 1_000
-        volume_prec_lago = area_media * precipitacao / 1_000
+    cota_final, area_media, volume_evap_lago, volume_prec_lago = calcula_evaporacao_do_lago_em_arrays(
+        volume_inicial=volume_inicial,
+        volume_afluente=volume_afluente,
+        volume_turbinado=volume_turbinado,
+        volume_retirada=volume_retirada,
+        evaporacao=evaporacao,
+        precipitacao=precipitacao,
+        tabela_cav=reservatorio.cav.tabela(),
+        backend=backend
+    )
 
     return  {
         'cota_final': cota_final,
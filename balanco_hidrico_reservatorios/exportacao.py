@@ -0,0 +1,218 @@
+import csv
+import re
+from collections import Counter
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Literal, Mapping
+
+FormatoDeExportacao = Literal['parquet', 'csv', 'xlsx']
+
+EXTENSOES: dict[str, FormatoDeExportacao] = {
+    '.parquet': 'parquet',
+    '.csv': 'csv',
+    '.xlsx': 'xlsx'
+}
+
+TAMANHO_DO_LOTE = 10_000
+
+
+class FormatoDeExportacaoIndisponivel(Exception):
+    def __init__(self, message):
+        self.message = message
+
+
+def _gera_lotes(
+    colunas: list[str], linhas: Iterable[Mapping[str, Any]], tamanho_do_lote: int
+) -> Iterator[list[list[Any]]]:
+    iterador = iter(linhas)
+    while lote := list(islice(iterador, tamanho_do_lote)):
+        yield [[_converte_valor(linha[coluna]) for coluna in colunas] for linha in lote]
+
+
+def _converte_valor(valor: Any) -> Any:
+    if isinstance(valor, (str, int, float, bool)) or valor is None:
+        return valor
+    if hasattr(valor, 'item'):
+        return valor.item()
+    return str(valor)
+
+
+def _colunas_e_linhas(linhas: Iterable[Mapping[str, Any]]) -> tuple[list[str], Iterable[Mapping[str, Any]]]:
+    iterador = iter(linhas)
+    primeira_linha = next(iterador, None)
+    if primeira_linha is None:
+        return [], []
+    return list(primeira_linha.keys()), chain([primeira_linha], iterador)
+
+
+def _escreve_csv(caminho: Path, colunas: list[str], lotes: Iterator[list[list[Any]]]) -> None:
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(colunas)
+        for lote in lotes:
+            escritor.writerows(lote)
+
+
+def _escreve_parquet(caminho: Path, colunas: list[str], lotes: Iterator[list[list[Any]]]) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise FormatoDeExportacaoIndisponivel(
+            "A exportação em Parquet requer o pacote pyarrow instalado -> instale o extra 'parquet' "
+            "(pip install balanco-hidrico-reservatorios[parquet])"
+        ) from None
+
+    escritor = None
+    try:
+        for lote in lotes:
+            colunas_do_lote = dict(zip(colunas, (list(valores) for valores in zip(*lote))))
+            if escritor is None:
+                escritor = pq.ParquetWriter(caminho, _esquema_parquet(pa, colunas_do_lote))
+            escritor.write_table(pa.Table.from_pydict(colunas_do_lote, schema=escritor.schema))
+        if escritor is None:
+            escritor = pq.ParquetWriter(caminho, pa.schema([(coluna, pa.float64()) for coluna in colunas]))
+        escritor.close()
+    except Exception:
+        if escritor is not None:
+            escritor.close()
+        caminho.unlink(missing_ok=True)
+        raise
+
+
+def _esquema_parquet(pa, colunas_do_lote: dict[str, list[Any]]):
+    """Colunas de texto (ex.: 'periodo') são gravadas como string e as booleanas como bool; as
+    demais, inclusive inteiras ou sem valores no primeiro lote, como float64, para que os lotes
+    seguintes não dependam dos tipos do primeiro."""
+
+    campos = []
+    for coluna, valores in colunas_do_lote.items():
+        tipos = {type(valor) for valor in valores if valor is not None}
+        if str in tipos:
+            tipo = pa.string()
+        elif tipos == {bool}:
+            tipo = pa.bool_()
+        else:
+            tipo = pa.float64()
+        campos.append((coluna, tipo))
+    return pa.schema(campos)
+
+
+def _abre_planilha():
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        raise FormatoDeExportacaoIndisponivel(
+            "A exportação em planilha requer o pacote openpyxl instalado -> instale o extra 'xlsx' "
+            "(pip install balanco-hidrico-reservatorios[xlsx])"
+        ) from None
+    return Workbook(write_only=True)
+
+
+def _escreve_aba(planilha, nome_da_aba: str, colunas: list[str], lotes: Iterator[list[list[Any]]]) -> None:
+    aba = planilha.create_sheet(title=nome_da_aba[:31])
+    aba.append(colunas)
+    for lote in lotes:
+        for linha in lote:
+            aba.append(linha)
+
+
+def _nomes_seguros(nomes: list[str], comprimento_maximo: int | None) -> dict[str, str]:
+    """Substitui por '_' os separadores de caminho e os caracteres não aceitos em nomes de arquivo
+    ou de aba, para que o nome de um reservatório não grave fora do diretório de saída."""
+
+    nomes_seguros = {
+        nome: re.sub(r'[\\/:*?"<>|\[\]\x00-\x1f]', '_', nome).strip('. ')[:comprimento_maximo] or '_'
+        for nome in nomes
+    }
+    contagem = Counter(nomes_seguros.values())
+    repetidos = [nome for nome in nomes if contagem[nomes_seguros[nome]] > 1]
+    if repetidos:
+        raise ValueError(f"Nomes de reservatórios repetidos após a adaptação para nomes de arquivo -> {repetidos}")
+    return nomes_seguros
+
+
+def _formato_do_caminho(caminho: Path, formato: FormatoDeExportacao | None) -> FormatoDeExportacao:
+    if formato is not None:
+        return formato
+    if caminho.suffix not in EXTENSOES:
+        raise ValueError(
+            f"Não foi possível identificar o formato do arquivo '{caminho}' -> extensões válidas: {list(EXTENSOES)}"
+        )
+    return EXTENSOES[caminho.suffix]
+
+
+def exporta_resultados(
+    resultados: Iterable[Mapping[str, Any]],
+    caminho: str | Path,
+    formato: FormatoDeExportacao | None = None,
+    tamanho_do_lote: int = TAMANHO_DO_LOTE,
+    nome_da_aba: str = 'balanco_hidrico'
+) -> Path:
+    """Grava, em lotes de tamanho fixo e sem DataFrame intermediário, resultados de uma simulação
+    (ex.: list[ResultadoBHNoPeriodo]) em Parquet, CSV ou planilha. O formato é inferido da extensão
+    do arquivo quando não informado e os períodos são gravados como texto."""
+
+    caminho = Path(caminho)
+    formato = _formato_do_caminho(caminho, formato)
+    caminho.parent.mkdir(parents=True, exist_ok=True)
+    colunas, linhas = _colunas_e_linhas(resultados)
+    lotes = _gera_lotes(colunas, linhas, tamanho_do_lote)
+
+    if formato == 'csv':
+        _escreve_csv(caminho, colunas, lotes)
+    elif formato == 'parquet':
+        _escreve_parquet(caminho, colunas, lotes)
+    elif formato == 'xlsx':
+        planilha = _abre_planilha()
+        _escreve_aba(planilha, nome_da_aba, colunas, lotes)
+        planilha.save(caminho)
+    else:
+        raise ValueError(f"Formato inválido: {formato} -> formatos válidos: {list(EXTENSOES.values())}")
+
+    return caminho
+
+
+def exporta_resultados_da_frota(
+    resultados_por_reservatorio: Mapping[str, Iterable[Mapping[str, Any]]],
+    diretorio: str | Path,
+    formato: FormatoDeExportacao,
+    particionado: bool = False,
+    tamanho_do_lote: int = TAMANHO_DO_LOTE
+) -> list[Path]:
+    """Grava os resultados de vários reservatórios em 'diretorio'.
+
+    Sem particionamento, gera um arquivo por reservatório (<nome>.<formato>). Com particionamento,
+    gera um único conjunto de dados: diretórios 'reservatorio=<nome>' (Parquet e CSV) ou uma
+    planilha com uma aba por reservatório (xlsx). Separadores de caminho e caracteres inválidos
+    no nome são substituídos por '_'."""
+
+    diretorio = Path(diretorio)
+    nomes_seguros = _nomes_seguros(
+        list(resultados_por_reservatorio), comprimento_maximo=31 if formato == 'xlsx' else None
+    )
+    diretorio.mkdir(parents=True, exist_ok=True)
+
+    if particionado and formato == 'xlsx':
+        planilha = _abre_planilha()
+        for nome, resultados in resultados_por_reservatorio.items():
+            colunas, linhas = _colunas_e_linhas(resultados)
+            _escreve_aba(planilha, nomes_seguros[nome], colunas, _gera_lotes(colunas, linhas, tamanho_do_lote))
+        caminho = diretorio / 'frota.xlsx'
+        planilha.save(caminho)
+        return [caminho]
+
+    caminhos: list[Path] = []
+    for nome, resultados in resultados_por_reservatorio.items():
+        if particionado:
+            caminho = diretorio / f"reservatorio={nomes_seguros[nome]}" / f"parte-0.{formato}"
+        else:
+            caminho = diretorio / f"{nomes_seguros[nome]}.{formato}"
+        caminhos.append(exporta_resultados(
+            resultados=resultados,
+            caminho=caminho,
+            formato=formato,
+            tamanho_do_lote=tamanho_do_lote,
+            nome_da_aba=nomes_seguros[nome]
+        ))
+    return caminhos
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Literal, TypedDict
+
+import numpy as np
+
+from balanco_hidrico_reservatorios.balanco_hidrico import ResultadoBHNoPeriodo
+from balanco_hidrico_reservatorios.reservatorios import Reservatorio
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+EstadoDoReservatorio = Literal["Vertimento", "Déficit", "Normal"]
+
+ESTADOS: tuple[EstadoDoReservatorio, ...] = ("Vertimento", "Déficit", "Normal")
+_VERTIMENTO, _DEFICIT, _NORMAL = range(3)
+
+
+class EventoNoReservatorio(TypedDict):
+    estado: EstadoDoReservatorio
+    periodo_inicial: pd.Period
+    periodo_final: pd.Period
+    numero_de_periodos: int
+
+
+class Deplecionamento(TypedDict):
+    periodo_inicial: pd.Period
+    periodo_final: pd.Period
+    numero_de_periodos: int
+
+
+class IndiceDeEventos:
+    """Índice, construído uma única vez sobre o resultado de um balanço hídrico, com a codificação
+    por sequências (run-length) dos estados de vertimento, déficit e normal e com os deplecionamentos
+    do reservatório, do último período cheio até o último período no volume mínimo antes de
+    voltar a encher."""
+
+    def __init__(self, reservatorio: Reservatorio, balanco_hidrico: list[ResultadoBHNoPeriodo]) -> None:
+        volume_maximo = reservatorio.volume.maximo
+        volume_minimo = reservatorio.volume.minimo
+
+        self.periodos = [resultado['periodo'] for resultado in balanco_hidrico]
+        volumes_finais = np.array([resultado['volume_final_hm3'] for resultado in balanco_hidrico], dtype=float)
+        volumes_vertidos = np.array([resultado['volume_vertido_hm3'] for resultado in balanco_hidrico], dtype=float)
+
+        estados = np.where(
+            volumes_vertidos > 0, _VERTIMENTO, np.where(volumes_finais <= volume_minimo, _DEFICIT, _NORMAL)
+        )
+        mudancas = np.flatnonzero(estados[1:] != estados[:-1]) + 1
+        num_periodos = estados.size
+        self._inicios = np.concatenate([[0], mudancas]) if num_periodos else np.array([], dtype=int)
+        self._fins = np.concatenate([mudancas - 1, [num_periodos - 1]]) if num_periodos else np.array([], dtype=int)
+        self._estados = estados[self._inicios]
+
+        deficits = self._estados == _DEFICIT
+        self._inicios_deficit = self._inicios[deficits]
+        self._fins_deficit = self._fins[deficits]
+        duracoes = self._fins_deficit - self._inicios_deficit + 1
+        self._ordem_das_secas = np.argsort(-duracoes, kind='stable')
+
+        self._deplecionamentos = self.__calcula_deplecionamentos(
+            cheios=np.flatnonzero(volumes_finais >= volume_maximo),
+            deficits=np.flatnonzero(estados == _DEFICIT)
+        )
+        self._periodo_critico = max(
+            self._deplecionamentos, key=lambda deplecionamento: deplecionamento[1] - deplecionamento[0], default=None
+        )
+
+    @staticmethod
+    def __calcula_deplecionamentos(cheios: np.ndarray, deficits: np.ndarray) -> list[tuple[int, int]]:
+        ultimo_cheio = np.searchsorted(cheios, deficits) - 1
+        deficits = deficits[ultimo_cheio >= 0]
+        ultimo_cheio = ultimo_cheio[ultimo_cheio >= 0]
+        if not deficits.size:
+            return []
+
+        ultimo_deficit_do_ciclo = np.concatenate([ultimo_cheio[1:] != ultimo_cheio[:-1], [True]])
+        inicios = cheios[ultimo_cheio[ultimo_deficit_do_ciclo]] + 1
+        fins = deficits[ultimo_deficit_do_ciclo]
+        return list(zip(inicios.tolist(), fins.tolist()))
+
+    def __evento(self, estado: int, inicio: int, fim: int) -> EventoNoReservatorio:
+        inicio, fim = int(inicio), int(fim)
+        return {
+            'estado': ESTADOS[estado],
+            'periodo_inicial': self.periodos[inicio],
+            'periodo_final': self.periodos[fim],
+            'numero_de_periodos': fim - inicio + 1
+        }
+
+    def __deplecionamento(self, inicio: int, fim: int) -> Deplecionamento:
+        return {
+            'periodo_inicial': self.periodos[inicio],
+            'periodo_final': self.periodos[fim],
+            'numero_de_periodos': fim - inicio + 1
+        }
+
+    @property
+    def sequencia_de_estados(self) -> list[EventoNoReservatorio]:
+        return [
+            self.__evento(estado, inicio, fim)
+            for estado, inicio, fim in zip(self._estados.tolist(), self._inicios.tolist(), self._fins.tolist())
+        ]
+
+    @property
+    def deplecionamentos(self) -> list[Deplecionamento]:
+        return [self.__deplecionamento(inicio, fim) for inicio, fim in self._deplecionamentos]
+
+    def estado_no_periodo(self, periodo: pd.Period) -> EstadoDoReservatorio:
+        posicao = bisect_left(self.periodos, periodo)
+        if posicao == len(self.periodos) or self.periodos[posicao] != periodo:
+            raise KeyError(f"Período {periodo} não existe no resultado do balanço hídrico")
+        sequencia = np.searchsorted(self._inicios, posicao, side='right') - 1
+        return ESTADOS[self._estados[sequencia]]
+
+    def periodo_critico(self) -> Deplecionamento | None:
+        """Retorna o maior deplecionamento, do reservatório cheio ao volume mínimo."""
+        if self._periodo_critico is None:
+            return None
+        return self.__deplecionamento(*self._periodo_critico)
+
+    def maiores_secas(self, k: int) -> list[EventoNoReservatorio]:
+        """Retorna as k maiores sequências de períodos em déficit, da mais longa para a mais curta."""
+        return [
+            self.__evento(_DEFICIT, self._inicios_deficit[i], self._fins_deficit[i])
+            for i in self._ordem_das_secas[:k].tolist()
+        ]
+
+    def periodos_de_deficit(self, inicio: pd.Period, fim: pd.Period) -> list[EventoNoReservatorio]:
+        """Retorna as sequências de períodos em déficit com algum período entre inicio e fim."""
+        pos_inicio = bisect_left(self.periodos, inicio)
+        pos_fim = bisect_right(self.periodos, fim) - 1
+        if pos_inicio > pos_fim:
+            return []
+        primeira = np.searchsorted(self._fins_deficit, pos_inicio, side='left')
+        ultima = np.searchsorted(self._inicios_deficit, pos_fim, side='right')
+        return [
+            self.__evento(_DEFICIT, self._inicios_deficit[i], self._fins_deficit[i])
+            for i in range(primeira, ultima)
+        ]
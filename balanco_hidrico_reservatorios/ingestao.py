@@ -0,0 +1,42 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, TypeVar
+
+Item = TypeVar('Item')
+Carregado = TypeVar('Carregado')
+
+_FIM = object()
+
+
+def carrega_antecipadamente(
+    itens: Iterable[Item],
+    carregador: Callable[[Item], Carregado],
+    profundidade: int = 2,
+    num_threads: int | None = None
+) -> Iterator[tuple[Item, 'Future[Carregado]']]:
+    """Carrega, em um pool de threads, os próximos 'profundidade' itens enquanto o item atual é
+    processado pelo consumidor. Os itens são entregues na ordem de entrada, cada um com o Future do
+    seu carregamento, de modo que uma falha de leitura só é levantada ao chamar result() e não
+    interrompe os demais itens.
+
+    A fila é limitada: no máximo 'profundidade' itens ficam carregados ou em carregamento à frente
+    do item entregue ao consumidor."""
+
+    if profundidade < 1:
+        raise ValueError("Profundidade do pré-carregamento deve ser maior ou igual a 1")
+
+    iterador = iter(itens)
+    executor = ThreadPoolExecutor(max_workers=num_threads or profundidade, thread_name_prefix='ingestao')
+    try:
+        fila: deque[tuple[Item, Future[Carregado]]] = deque(
+            (item, executor.submit(carregador, item)) for item in islice(iterador, profundidade)
+        )
+        while fila:
+            item, futuro = fila.popleft()
+            proximo = next(iterador, _FIM)
+            if proximo is not _FIM:
+                fila.append((proximo, executor.submit(carregador, proximo)))  # type: ignore
+            yield item, futuro
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
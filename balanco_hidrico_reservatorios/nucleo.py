@@ -0,0 +1,327 @@
+import types
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+Backend = Literal['python', 'numba']
+
+PrioridadeDeAtendimento = Literal["Vazão Turbinada", "Vazão das Demandas"]
+
+_PRIORIDADES: dict[str, int] = {
+    "Vazão das Demandas": 1,
+    "Vazão Turbinada": 2
+}
+
+COLUNAS_DO_NUCLEO: tuple[str, ...] = (
+    'cota_inicial',
+    'cota_final',
+    'vazao_turbinada_m3_s',
+    'vazao_demandas_m3_s',
+    'area_lago_km2',
+    'volume_afluente_hm3',
+    'volume_turbinado_hm3',
+    'volume_inicial_hm3',
+    'volume_final_hm3',
+    'volume_vertido_hm3',
+    'volume_evaporado_hm3',
+    'volume_precipitado_hm3'
+)
+
+
+class BackendIndisponivel(Exception):
+    def __init__(self, message):
+        self.message = message
+
+
+@dataclass(frozen=True)
+class TabelaCav:
+    """Pontos da curva Cota-Área-Volume ordenados por cota. Quando 'coeficientes_area' não é vazio,
+    a área é calculada pelo polinômio da cota (CAV do ONS) e 'areas' não é utilizado."""
+    cotas: NDArray = field(repr=False)
+    areas: NDArray = field(repr=False)
+    volumes: NDArray = field(repr=False)
+    coeficientes_area: NDArray = field(default_factory=lambda: np.empty(0), repr=False)
+
+    def calcula_area_por(self, *, cota: float) -> float:
+        return self.calcula_areas_por(cotas=np.array([cota]))[0]
+
+    def calcula_areas_por(self, *, cotas: NDArray) -> NDArray:
+        if self.coeficientes_area.size:
+            return np.polynomial.polynomial.polyval(cotas, self.coeficientes_area)
+        return interpola_em_arrays(self.cotas, self.areas, cotas)
+
+    def calcula_volume_por(self, *, cota: float) -> float:
+        return interpola_em_arrays(self.cotas, self.volumes, np.array([cota]))[0]
+
+    def calcula_volumes_por(self, *, cotas: NDArray) -> NDArray:
+        return interpola_em_arrays(self.cotas, self.volumes, cotas)
+
+    def calcula_cota_por(self, *, volume: float) -> float:
+        return interpola_em_arrays(self.volumes, self.cotas, np.array([volume]))[0]
+
+    def calcula_cotas_por(self, *, volumes: NDArray) -> NDArray:
+        return interpola_em_arrays(self.volumes, self.cotas, volumes)
+
+    def tabela(self) -> 'TabelaCav':
+        return self
+
+
+def interpola_em_arrays(referencia: NDArray, alvo: NDArray, valores: NDArray) -> NDArray:
+    """Interpola linearmente 'alvo' em função de 'referencia' (ordenada) para cada um dos 'valores',
+    com a mesma escolha de segmentos da recorrência do balanço hídrico."""
+
+    tamanho = alvo.size
+    idx = np.searchsorted(referencia, valores)
+    idx_corrigido = np.where(idx < tamanho - 1, idx, tamanho - 1)
+    idx_esq = np.where(idx_corrigido < tamanho - 1, idx_corrigido, idx_corrigido - 1)
+    idx_dir = np.where(idx_corrigido < tamanho - 2, idx_corrigido + 1, tamanho - 1)
+
+    referencia_esq = referencia[idx_esq]
+    referencia_dir = referencia[idx_dir]
+    alvo_esq = alvo[idx_esq]
+    alvo_dir = alvo[idx_dir]
+
+    return alvo_dir - (referencia_dir - valores) * (alvo_dir - alvo_esq) / (referencia_dir - referencia_esq)
+
+
+def _busca_indice(referencia, valor):
+    esquerda = 0
+    direita = len(referencia)
+    while esquerda < direita:
+        meio = (esquerda + direita) // 2
+        if referencia[meio] < valor:
+            esquerda = meio + 1
+        else:
+            direita = meio
+    return esquerda
+
+
+def _interpola(referencia, alvo, valor):
+    tamanho = len(alvo)
+    idx = _busca_indice(referencia, valor)
+    idx_corrigido = idx if idx < tamanho - 1 else tamanho - 1
+    idx_esq = idx_corrigido if idx_corrigido < tamanho - 1 else idx_corrigido - 1
+    idx_dir = idx_corrigido + 1 if idx_corrigido < tamanho - 2 else tamanho - 1
+    return alvo[idx_dir] - (referencia[idx_dir] - valor) * \
+        (alvo[idx_dir] - alvo[idx_esq]) / (referencia[idx_dir] - referencia[idx_esq])
+
+
+def _calcula_area(cota, cotas, areas, coeficientes_area):
+    num_coeficientes = len(coeficientes_area)
+    if num_coeficientes == 0:
+        return _interpola(cotas, areas, cota)
+    area = coeficientes_area[num_coeficientes - 1]
+    for i in range(num_coeficientes - 2, -1, -1):
+        area = coeficientes_area[i] + area * cota
+    return area
+
+
+def _calcula_evaporacao(
+    volume_inicial, volume_afluente, volume_turbinado, volume_retirada, evaporacao, precipitacao,
+    cotas, areas, volumes, coeficientes_area
+):
+    cota_inicial = _interpola(volumes, cotas, volume_inicial)
+    area_corresp_inicial = _calcula_area(cota_inicial, cotas, areas, coeficientes_area)
+
+    volume_sem_evap = volume_inicial + volume_afluente - volume_retirada - volume_turbinado
+
+    volume_evap_lago = 0.0
+    volume_prec_lago = 0.0
+    cota_final = cota_inicial
+    area_media = area_corresp_inicial
+    diferenca = 99999.0
+    while (diferenca > 0.1):
+        volume_final = volume_sem_evap - volume_evap_lago + volume_prec_lago
+        cota_final = _interpola(volumes, cotas, volume_final)
+        area_corresp_final = _calcula_area(cota_final, cotas, areas, coeficientes_area)
+        area_media = (area_corresp_inicial + area_corresp_final) / 2
+        diferenca = abs((volume_prec_lago - volume_evap_lago) - area_media * (precipitacao - evaporacao) / 1_000)
+        volume_evap_lago = area_media * evaporacao / 1_000
+        volume_prec_lago = area_media * precipitacao / 1_000
+
+    return cota_final, area_media, volume_evap_lago, volume_prec_lago
+
+
+def _calcula_balanco(
+    volume_inicial, volume_minimo, volume_maximo, prioridade,
+    vazoes_afluentes, vazoes_turbinadas, vazoes_retiradas, evaporacoes, precipitacoes, fatores_q_para_vol,
+    cotas, areas, volumes, coeficientes_area, saida
+):
+    for t in range(len(fatores_q_para_vol)):
+        factor_q_to_vol = fatores_q_para_vol[t]
+        vazao_afluente = vazoes_afluentes[t]
+        vazao_turbinada = vazoes_turbinadas[t]
+        vazao_retirada = vazoes_retiradas[t]
+        evaporacao = evaporacoes[t]
+        precipitacao = precipitacoes[t]
+
+        volume_vertido = 0.0
+        volume_afluente = vazao_afluente * factor_q_to_vol
+        volume_turbinado = vazao_turbinada * factor_q_to_vol
+        volume_retirada = vazao_retirada * factor_q_to_vol
+        cota_inicial = _interpola(volumes, cotas, volume_inicial)
+        area_corresp_inicial = _calcula_area(cota_inicial, cotas, areas, coeficientes_area)
+        volume_final = volume_inicial + volume_afluente - volume_turbinado - volume_retirada\
+            + area_corresp_inicial * (precipitacao - evaporacao) / 1_000
+
+        if volume_final > volume_maximo:
+            volume_vertido = volume_final - volume_maximo
+            cota_final = _interpola(volumes, cotas, volume_maximo)
+            area_lago = _calcula_area(cota_final, cotas, areas, coeficientes_area)
+            volume_evap_lago = area_lago * evaporacao / 1_000
+            volume_prec_lago = area_lago * precipitacao / 1_000
+            volume_final = min(volume_maximo, volume_inicial + volume_afluente - volume_turbinado\
+                - volume_retirada + area_lago * (precipitacao - evaporacao) / 1_000)
+
+        elif volume_final <= volume_minimo:
+            volume_final = volume_minimo
+            cota_final = _interpola(volumes, cotas, volume_final)
+            area_lago = _calcula_area(cota_final, cotas, areas, coeficientes_area)
+            volume_evap_lago = area_lago * evaporacao / 1_000
+            volume_prec_lago = area_lago * precipitacao / 1_000
+
+            delta_vol = max(0.0, volume_inicial - volume_minimo - volume_evap_lago + volume_prec_lago)
+
+            if prioridade == 1:
+                vazao_retirada = min(vazao_retirada, delta_vol / factor_q_to_vol)
+                volume_retirada = vazao_retirada * factor_q_to_vol
+                delta_vol = max(0.0, volume_inicial - volume_minimo + volume_afluente\
+                    - volume_retirada - volume_evap_lago + volume_prec_lago)
+                vazao_turbinada = min(vazao_turbinada, delta_vol / factor_q_to_vol)
+                volume_turbinado = vazao_turbinada * factor_q_to_vol
+
+            if prioridade == 2:
+                vazao_turbinada = min(vazao_turbinada, delta_vol / factor_q_to_vol)
+                volume_turbinado = vazao_turbinada * factor_q_to_vol
+                delta_vol = max(0.0, volume_inicial - volume_minimo + volume_afluente\
+                    - volume_turbinado - volume_evap_lago + volume_prec_lago)
+                vazao_retirada = min(vazao_retirada, delta_vol / factor_q_to_vol)
+                volume_retirada = vazao_retirada * factor_q_to_vol
+
+        else:
+            cota_final, area_lago, volume_evap_lago, volume_prec_lago = _calcula_evaporacao(
+                volume_inicial, volume_afluente, volume_turbinado, volume_retirada, evaporacao, precipitacao,
+                cotas, areas, volumes, coeficientes_area
+            )
+            volume_final = volume_inicial + volume_afluente - volume_evap_lago + volume_prec_lago\
+                - volume_retirada - volume_turbinado
+
+        saida[t, 0] = cota_inicial
+        saida[t, 1] = cota_final
+        saida[t, 2] = vazao_turbinada
+        saida[t, 3] = vazao_retirada
+        saida[t, 4] = area_lago
+        saida[t, 5] = volume_afluente
+        saida[t, 6] = volume_turbinado
+        saida[t, 7] = volume_inicial
+        saida[t, 8] = volume_final
+        saida[t, 9] = volume_vertido
+        saida[t, 10] = volume_evap_lago
+        saida[t, 11] = volume_prec_lago
+
+        volume_inicial = volume_final
+
+
+_FUNCOES_DO_KERNEL = ('_busca_indice', '_interpola', '_calcula_area', '_calcula_evaporacao', '_calcula_balanco')
+
+
+def _compila_kernel_com_numba() -> tuple[Callable, Callable]:
+    """Compila as funções do kernel com numba. Cada função é recriada com um dicionário de globais
+    próprio, em que as chamadas internas apontam para as versões compiladas, e a compilação é
+    armazenada em cache no disco, evitando recompilar a cada processo."""
+
+    import numba
+
+    jit = numba.njit(cache=True, nogil=True)
+    globais: dict = {'__name__': __name__}
+    for nome in _FUNCOES_DO_KERNEL:
+        funcao = globals()[nome]
+        globais[nome] = jit(types.FunctionType(funcao.__code__, globais, nome, funcao.__defaults__))
+    return globais['_calcula_evaporacao'], globais['_calcula_balanco']
+
+
+@lru_cache(maxsize=None)
+def _obtem_kernel(backend: Backend) -> tuple[Callable, Callable]:
+    if backend == 'python':
+        return _calcula_evaporacao, _calcula_balanco
+
+    if backend == 'numba':
+        try:
+            return _compila_kernel_com_numba()
+        except ImportError:
+            raise BackendIndisponivel(
+                "O backend 'numba' requer o pacote numba instalado -> instale o extra 'numba' "
+                "(pip install balanco-hidrico-reservatorios[numba]) ou utilize o backend 'python'"
+            ) from None
+
+    raise ValueError(f"Backend inválido: {backend} -> backends válidos: 'python', 'numba'")
+
+
+def _codigo_da_prioridade(prioridade_de_atendimento: PrioridadeDeAtendimento) -> int:
+    if prioridade_de_atendimento not in _PRIORIDADES:
+        raise ValueError(
+            f"Prioridade de atendimento inválida: {prioridade_de_atendimento} -> "
+            f"prioridades válidas: {list(_PRIORIDADES)}"
+        )
+    return _PRIORIDADES[prioridade_de_atendimento]
+
+
+def _prepara_argumentos(backend: Backend, *arrays: NDArray) -> list:
+    if backend == 'python':
+        return [np.asarray(array).tolist() for array in arrays]
+    return [np.ascontiguousarray(array, dtype=np.float64) for array in arrays]
+
+
+def calcula_evaporacao_do_lago_em_arrays(
+    volume_inicial: float,
+    volume_afluente: float,
+    volume_turbinado: float,
+    volume_retirada: float,
+    evaporacao: float,
+    precipitacao: float,
+    tabela_cav: TabelaCav,
+    backend: Backend = 'python'
+) -> tuple[float, float, float, float]:
+    """Retorna cota final, área média do lago, volume evaporado e volume precipitado no período."""
+
+    calcula_evaporacao, _ = _obtem_kernel(backend)
+    return calcula_evaporacao(
+        volume_inicial, volume_afluente, volume_turbinado, volume_retirada, evaporacao, precipitacao,
+        *_prepara_argumentos(
+            backend, tabela_cav.cotas, tabela_cav.areas, tabela_cav.volumes, tabela_cav.coeficientes_area
+        )
+    )
+
+
+def calcula_balanco_hidrico_em_arrays(
+    volume_inicial: float,
+    volume_minimo: float,
+    volume_maximo: float,
+    prioridade_de_atendimento: PrioridadeDeAtendimento,
+    vazoes_afluentes: NDArray,
+    vazoes_turbinadas: NDArray,
+    vazoes_retiradas: NDArray,
+    evaporacoes: NDArray,
+    precipitacoes: NDArray,
+    fatores_q_para_vol: NDArray,
+    tabela_cav: TabelaCav,
+    backend: Backend = 'python'
+) -> NDArray:
+    """Executa a recorrência do balanço hídrico sobre arrays e retorna uma matriz (passos x colunas)
+    com as colunas de COLUNAS_DO_NUCLEO."""
+
+    _, calcula_balanco = _obtem_kernel(backend)
+    saida = np.empty((len(fatores_q_para_vol), len(COLUNAS_DO_NUCLEO)), dtype=np.float64)
+    calcula_balanco(
+        volume_inicial, volume_minimo, volume_maximo, _codigo_da_prioridade(prioridade_de_atendimento),
+        *_prepara_argumentos(
+            backend, vazoes_afluentes, vazoes_turbinadas, vazoes_retiradas, evaporacoes, precipitacoes,
+            fatores_q_para_vol, tabela_cav.cotas, tabela_cav.areas, tabela_cav.volumes,
+            tabela_cav.coeficientes_area
+        ),
+        saida
+    )
+    return saida
@@ -1,8 +1,6 @@
 from abc import ABC
 from dataclasses import dataclass, field
 
-import pandas as pd
-
 from balanco_hidrico_reservatorios.cavs import CAV, CavReservatorio, CavReservatorioONS
 from balanco_hidrico_reservatorios.serie_temporal import SerieTemporal
 
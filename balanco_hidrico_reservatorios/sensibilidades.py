@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from typing import Literal, TypedDict
+
+import numpy as np
+from numpy.typing import NDArray
+
+from balanco_hidrico_reservatorios.balanco_hidrico import _prepara_balanco_hidrico
+from balanco_hidrico_reservatorios.calendario import calcula_fatores_q_para_vol
+from balanco_hidrico_reservatorios.nucleo import (
+    COLUNAS_DO_NUCLEO,
+    PrioridadeDeAtendimento,
+    _codigo_da_prioridade,
+    _obtem_kernel,
+)
+from balanco_hidrico_reservatorios.reservatorios import Reservatorio
+from balanco_hidrico_reservatorios.serie_temporal import SerieTemporal
+
+ParametroDeSensibilidade = Literal[
+    'evaporacao', 'vazao_retirada', 'volume_maximo', 'cotas_cav', 'areas_cav', 'volumes_cav'
+]
+
+PARAMETROS_DE_SENSIBILIDADE: tuple[ParametroDeSensibilidade, ...] = (
+    'evaporacao', 'vazao_retirada', 'volume_maximo', 'cotas_cav', 'areas_cav', 'volumes_cav'
+)
+
+
+class Sensibilidade(TypedDict):
+    valor: float
+    derivadas: dict[ParametroDeSensibilidade, float | NDArray]
+
+
+class ResultadoSensibilidades(TypedDict):
+    volume_final_hm3: Sensibilidade
+    volume_vertido_hm3: Sensibilidade
+    deficit_hm3: Sensibilidade
+
+
+class _Dual:
+    """Número dual: valor e gradiente em relação aos parâmetros analisados. As comparações usam
+    apenas o valor, de modo que os ramos da recorrência (vertimento, volume mínimo, segmento da CAV)
+    são os mesmos da simulação com floats e as derivadas seguem o ramo escolhido."""
+
+    __slots__ = ('valor', 'gradiente')
+
+    def __init__(self, valor: float, gradiente: NDArray) -> None:
+        self.valor = valor
+        self.gradiente = gradiente
+
+    def __add__(self, outro):
+        if isinstance(outro, _Dual):
+            return _Dual(self.valor + outro.valor, self.gradiente + outro.gradiente)
+        return _Dual(self.valor + outro, self.gradiente)
+
+    __radd__ = __add__
+
+    def __sub__(self, outro):
+        if isinstance(outro, _Dual):
+            return _Dual(self.valor - outro.valor, self.gradiente - outro.gradiente)
+        return _Dual(self.valor - outro, self.gradiente)
+
+    def __rsub__(self, outro):
+        return _Dual(outro - self.valor, -self.gradiente)
+
+    def __mul__(self, outro):
+        if isinstance(outro, _Dual):
+            return _Dual(self.valor * outro.valor, self.gradiente * outro.valor + outro.gradiente * self.valor)
+        return _Dual(self.valor * outro, self.gradiente * outro)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, outro):
+        if isinstance(outro, _Dual):
+            return _Dual(
+                self.valor / outro.valor,
+                (self.gradiente * outro.valor - outro.gradiente * self.valor) / (outro.valor * outro.valor)
+            )
+        return _Dual(self.valor / outro, self.gradiente / outro)
+
+    def __rtruediv__(self, outro):
+        return _Dual(outro / self.valor, self.gradiente * (-outro / (self.valor * self.valor)))
+
+    def __neg__(self):
+        return _Dual(-self.valor, -self.gradiente)
+
+    def __abs__(self):
+        return self if self.valor >= 0 else -self
+
+    def __lt__(self, outro):
+        return self.valor < _valor(outro)
+
+    def __le__(self, outro):
+        return self.valor <= _valor(outro)
+
+    def __gt__(self, outro):
+        return self.valor > _valor(outro)
+
+    def __ge__(self, outro):
+        return self.valor >= _valor(outro)
+
+    def __float__(self) -> float:
+        return float(self.valor)
+
+
+def _valor(numero: _Dual | float) -> float:
+    return numero.valor if isinstance(numero, _Dual) else numero
+
+
+def _gradiente(numero: _Dual | float, num_parametros: int) -> NDArray:
+    return numero.gradiente if isinstance(numero, _Dual) else np.zeros(num_parametros)
+
+
+def _sementes(valores: list[float], inicio: int, num_parametros: int) -> list[_Dual]:
+    base = np.eye(num_parametros)
+    return [_Dual(valor, base[inicio + i]) for i, valor in enumerate(valores)]
+
+
+def _deslocamento_uniforme(valores: list[float], indice: int, num_parametros: int) -> list[_Dual]:
+    gradiente = np.zeros(num_parametros)
+    gradiente[indice] = 1.0
+    return [_Dual(valor, gradiente) for valor in valores]
+
+
+def calcula_sensibilidades(
+    reservatorio: Reservatorio,
+    serie_temporal: SerieTemporal | None,
+    percentual_volume_inicial: int,
+    prioridade_de_atendimento: PrioridadeDeAtendimento,
+    parametros: tuple[ParametroDeSensibilidade, ...] = PARAMETROS_DE_SENSIBILIDADE
+) -> ResultadoSensibilidades:
+    """Executa o balanço hídrico em modo direto (forward) de diferenciação automática e retorna o
+    volume final, o volume vertido total e o déficit total (volume das demandas e do turbinamento
+    não atendido), com as derivadas em relação aos parâmetros, em uma única simulação.
+
+    'evaporacao' (mm) e 'vazao_retirada' (m³/s) são deslocamentos uniformes somados a todos os
+    períodos da série. 'volume_maximo' inclui o efeito sobre o volume inicial, definido pelo
+    percentual entre os volumes mínimo e máximo. 'cotas_cav', 'areas_cav' e 'volumes_cav' retornam
+    uma derivada por ponto da CAV; na CAV do ONS, 'areas_cav' se refere aos coeficientes a..e do
+    polinômio da área."""
+
+    for parametro in parametros:
+        if parametro not in PARAMETROS_DE_SENSIBILIDADE:
+            raise ValueError(
+                f"Parâmetro inválido: {parametro} -> parâmetros válidos: {list(PARAMETROS_DE_SENSIBILIDADE)}"
+            )
+
+    serie_temporal, _ = _prepara_balanco_hidrico(reservatorio, serie_temporal, percentual_volume_inicial)
+    df_serie = serie_temporal.dataframe
+    freq = serie_temporal.freq
+    valores = serie_temporal.valores
+    fatores_q_para_vol = calcula_fatores_q_para_vol(df_serie.index, freq=freq).tolist()
+    tabela_cav = reservatorio.cav.tabela()
+    possui_polinomio_da_area = bool(tabela_cav.coeficientes_area.size)
+
+    entradas: dict[str, list] = {
+        'evaporacao': valores.evaporacao.tolist(),
+        'vazao_retirada': valores.vazao_retirada.tolist(),
+        'volume_maximo': [reservatorio.volume.maximo],
+        'cotas_cav': tabela_cav.cotas.tolist(),
+        'areas_cav': (tabela_cav.coeficientes_area if possui_polinomio_da_area else tabela_cav.areas).tolist(),
+        'volumes_cav': tabela_cav.volumes.tolist()
+    }
+    deslocamentos_uniformes = ('evaporacao', 'vazao_retirada')
+
+    fatias: dict[str, slice] = {}
+    num_parametros = 0
+    for parametro in parametros:
+        tamanho = 1 if parametro in deslocamentos_uniformes else len(entradas[parametro])
+        fatias[parametro] = slice(num_parametros, num_parametros + tamanho)
+        num_parametros += tamanho
+
+    for parametro, fatia in fatias.items():
+        if parametro in deslocamentos_uniformes:
+            entradas[parametro] = _deslocamento_uniforme(entradas[parametro], fatia.start, num_parametros)
+        else:
+            entradas[parametro] = _sementes(entradas[parametro], fatia.start, num_parametros)
+
+    # O volume inicial é recalculado a partir do volume máximo dual, para incluir o seu efeito nas derivadas
+    volume_maximo = entradas['volume_maximo'][0]
+    volume_minimo = reservatorio.volume.minimo
+    volume_inicial = volume_minimo + (volume_maximo - volume_minimo) * percentual_volume_inicial / 100
+
+    _, calcula_balanco = _obtem_kernel('python')
+    saida = np.empty((len(fatores_q_para_vol), len(COLUNAS_DO_NUCLEO)), dtype=object)
+    calcula_balanco(
+        volume_inicial, volume_minimo, volume_maximo, _codigo_da_prioridade(prioridade_de_atendimento),
+        valores.vazao_afluente.tolist(), valores.vazao_turbinada.tolist(), entradas['vazao_retirada'],
+        entradas['evaporacao'], valores.precipitacao.tolist(), fatores_q_para_vol,
+        entradas['cotas_cav'],
+        tabela_cav.areas.tolist() if possui_polinomio_da_area else entradas['areas_cav'],
+        entradas['volumes_cav'],
+        entradas['areas_cav'] if possui_polinomio_da_area else [],
+        saida
+    )
+
+    coluna = {nome: i for i, nome in enumerate(COLUNAS_DO_NUCLEO)}
+    volume_vertido_total = sum(saida[:, coluna['volume_vertido_hm3']].tolist(), 0.0)
+    deficit_total = sum(
+        (
+            (vazao_retirada - vazao_retirada_atendida) + (vazao_turbinada - vazao_turbinada_atendida)
+        ) * factor_q_to_vol
+        for vazao_retirada, vazao_retirada_atendida, vazao_turbinada, vazao_turbinada_atendida, factor_q_to_vol
+        in zip(
+            entradas['vazao_retirada'], saida[:, coluna['vazao_demandas_m3_s']].tolist(),
+            valores.vazao_turbinada.tolist(), saida[:, coluna['vazao_turbinada_m3_s']].tolist(),
+            fatores_q_para_vol
+        )
+    )
+
+    def sensibilidade(numero: _Dual | float) -> Sensibilidade:
+        gradiente = _gradiente(numero, num_parametros)
+        return {
+            'valor': float(_valor(numero)),
+            'derivadas': {
+                parametro: float(gradiente[fatia.start]) if parametro in deslocamentos_uniformes
+                or parametro == 'volume_maximo' else gradiente[fatia].copy()
+                for parametro, fatia in fatias.items()
+            }
+        }
+
+    return {
+        'volume_final_hm3': sensibilidade(saida[-1, coluna['volume_final_hm3']]),
+        'volume_vertido_hm3': sensibilidade(volume_vertido_total),
+        'deficit_hm3': sensibilidade(deficit_total)
+    }
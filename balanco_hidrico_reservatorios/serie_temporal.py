@@ -1,9 +1,22 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Literal, TypedDict
+from typing import TYPE_CHECKING, Literal, NamedTuple, TypedDict
+
+import numpy as np
+from numpy.typing import NDArray
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
-Frequencia = Literal['D', 'M']
+Frequencia = Literal['H', 'D', 'W', 'M']
+
+FREQUENCIAS_PANDAS: dict[str, str] = {
+    'H': 'h',
+    'D': 'D',
+    'W': '7D',
+    'M': 'M'
+}
 
 
 class SerieTemporalInvalida(Exception):
@@ -20,12 +33,14 @@ class NomeDaColunaInvalida(Exception):
 
 
 def _checa_indice_da_serie_temporal(serie_temporal: pd.DataFrame, freq: Frequencia) -> None:
+    import pandas as pd
+
     indice_serie = serie_temporal.index
     
-    if freq == 'D':
+    if freq in ('H', 'D', 'W'):
         if not isinstance(indice_serie, pd.DatetimeIndex):
             raise SerieTemporalInvalida(
-                "O DataFrame da série temporal com frequeência diária deve ser do Tipo "
+                "O DataFrame da série temporal com frequeência horária, diária ou semanal deve ser do Tipo "
                 f"DatetimeIndex -> tipo atual: {type(indice_serie)}"
             )
             
@@ -37,12 +52,14 @@ def _checa_indice_da_serie_temporal(serie_temporal: pd.DataFrame, freq: Frequenc
         
         
 def _checa_falhas_nas_datas_da_serie_temporal(serie_temporal: pd.DataFrame, freq: Frequencia = 'M') -> None:
+    import pandas as pd
+
     indice_serie = serie_temporal.index
     
-    if freq == 'D':
-        date_range = pd.date_range(indice_serie.min(), indice_serie.max(), freq=freq)
+    if freq in ('H', 'D', 'W'):
+        date_range = pd.date_range(indice_serie.min(), indice_serie.max(), freq=FREQUENCIAS_PANDAS[freq])
     if freq == 'M':
-        date_range = pd.period_range(indice_serie.min(), indice_serie.max(), freq=freq)
+        date_range = pd.period_range(indice_serie.min(), indice_serie.max(), freq=FREQUENCIAS_PANDAS[freq])
     
     if not indice_serie.equals(date_range):
         datas_ausentes = [i for i in indice_serie if i not in date_range]
@@ -71,9 +88,76 @@ class ColunasSerieTemporal(TypedDict):
     precipitacao: str
 
 
-@dataclass
+class ValoresSerieTemporal(NamedTuple):
+    vazao_afluente: NDArray
+    vazao_turbinada: NDArray
+    vazao_retirada: NDArray
+    evaporacao: NDArray
+    precipitacao: NDArray
+
+
+@dataclass(frozen=True)
 class SerieTemporal:
+    """Série temporal de entrada do balanço hídrico. As substituições, indexadas pelas chaves de
+    ColunasSerieTemporal, sobrepõem as colunas do DataFrame sem alterá-lo."""
     dataframe: pd.DataFrame = field(repr=False)
     nome_das_colunas: ColunasSerieTemporal
     freq: Frequencia
+    substituicoes: dict[str, float | NDArray] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        num_passos = len(self.dataframe.index)
+        for nome, valor in self.substituicoes.items():
+            if nome not in self.nome_das_colunas:
+                raise NomeDaColunaInvalida(
+                    f"Substituição '{nome}' inválida -> substituições válidas: {list(self.nome_das_colunas)}"
+                )
+            if np.ndim(valor) != 0 and np.shape(valor) != (num_passos,):
+                raise SerieTemporalInvalida(
+                    f"Substituição '{nome}' deve ser um escalar ou um array com um valor por passo -> "
+                    f"formato: {np.shape(valor)} - número de passos: {num_passos}"
+                )
+
+    @property
+    def valores(self) -> ValoresSerieTemporal:
+        """Arrays somente leitura, sem cópia, das cinco colunas mapeadas com as substituições aplicadas."""
+        num_passos = len(self.dataframe.index)
+        colunas_do_dataframe = [
+            coluna for nome, coluna in self.nome_das_colunas.items() if nome not in self.substituicoes
+        ]
+        _checa_nome_das_colunas(self.dataframe, colunas_do_dataframe)
+
+        valores: dict[str, NDArray] = {}
+        for nome, coluna in self.nome_das_colunas.items():
+            if nome in self.substituicoes:
+                valor = np.broadcast_to(np.asarray(self.substituicoes[nome], dtype=float), (num_passos,))
+            else:
+                valor = self.dataframe[coluna].to_numpy(dtype=float).view()
+                valor.flags.writeable = False
+            valores[nome] = valor
+
+        return ValoresSerieTemporal(**valores)
+
+    def com_substituicoes(self, **substituicoes: float | NDArray) -> 'SerieTemporal':
+        """Retorna uma nova série, sobre o mesmo DataFrame, com as substituições acrescentadas."""
+        return SerieTemporal(
+            dataframe=self.dataframe,
+            nome_das_colunas=self.nome_das_colunas,
+            freq=self.freq,
+            substituicoes={**self.substituicoes, **substituicoes}
+        )
+
+    def recorta(self, inicio, fim) -> 'SerieTemporal':
+        """Retorna a série entre os rótulos inicio e fim (inclusive), preservando as substituições."""
+        fatia = self.dataframe.index.slice_indexer(inicio, fim)
+        substituicoes = {
+            nome: valor if np.ndim(valor) == 0 else np.asarray(valor)[fatia]
+            for nome, valor in self.substituicoes.items()
+        }
+        return SerieTemporal(
+            dataframe=self.dataframe.iloc[fatia],
+            nome_das_colunas=self.nome_das_colunas,
+            freq=self.freq,
+            substituicoes=substituicoes
+        )
 
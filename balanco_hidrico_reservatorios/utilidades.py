@@ -1,7 +1,6 @@
-from calendar import monthrange
-
 import pandas as pd
 
+from balanco_hidrico_reservatorios.calendario import calcula_duracao_dos_passos_em_dias
 from balanco_hidrico_reservatorios.serie_temporal import (
     Frequencia,
     _checa_falhas_nas_datas_da_serie_temporal,
@@ -23,7 +22,7 @@ def gera_taxa_mensal_de_qturbinada_em_funcao_da_qafluente(
     _checa_falhas_nas_datas_da_serie_temporal(serie_temporal, freq=freq)
     _checa_nome_das_colunas(serie_temporal, colunas_df)
     
-    df = serie_temporal[colunas_df].copy()
+    df = serie_temporal[colunas_df]
     df_mean = df.groupby(df.index.month).mean()  # type: ignore
     df_mean['taxa'] = (df_mean[coluna_vazao_turbinada] / df_mean[coluna_vazao_afluente])
     
@@ -45,14 +44,11 @@ def insere_qturbinada_na_serie_temporal_com_taxa_mensal(
     coluna_vazao_afluente: str,
 ) -> pd.DataFrame:
     
-    df_serie = serie_temporal.copy()
-    
-    for mes in range(1, 13):
-        qturb = df_serie[df_serie.index.month == mes][coluna_vazao_afluente] \
-            * taxa_mensal_da_vazao_turbinada[mes]
-        df_serie.loc[df_serie.index.month == mes, [coluna_vazao_turbinada]] = qturb
+    taxas = serie_temporal.index.month.map(taxa_mensal_da_vazao_turbinada).to_numpy(dtype=float)  # type: ignore
     
-    return df_serie
+    return serie_temporal.assign(
+        **{coluna_vazao_turbinada: serie_temporal[coluna_vazao_afluente].to_numpy(dtype=float) * taxas}
+    )
     
     
 def gera_serie_pandas_a_partir_de_vetor_mensal(
@@ -67,20 +63,11 @@ def gera_serie_pandas_a_partir_de_vetor_mensal(
             f"Valores gerados: {vetor_mensal}"
         )
     
-    df_serie = serie_temporal.copy()
-    df_serie['vetor'] = None
-    
+    indice = serie_temporal.index
+    vetor = indice.month.map(vetor_mensal).to_numpy(dtype=float)  # type: ignore
     
-    if freq == "D":
-        df_serie['num_dias_no_mes'] = [monthrange(i.year, i.month)[1] for i in df_serie.index]
-                
-        for mes in range(1, 13):
-            df_serie.loc[df_serie.index.month == mes, ['vetor']] = \
-                vetor_mensal[mes] / df_serie.loc[df_serie.index.month == mes]['num_dias_no_mes']  # type: ignore
+    if freq in ("H", "D", "W"):
+        passos_no_mes = indice.days_in_month.to_numpy() / calcula_duracao_dos_passos_em_dias(indice, freq=freq)  # type: ignore
+        vetor = vetor / passos_no_mes
     
-    if freq == "M":
-        for mes in range(1, 13):
-            df_serie.loc[df_serie.index.month == mes, ['vetor']] = vetor_mensal[mes]  # type: ignore
-    
-    return df_serie['vetor']
-
+    return pd.Series(vetor, index=indice, name='vetor')
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from balanco_hidrico_reservatorios.cavs import CavReservatorio, CavReservatorioONS, CurvaCotaVolumeONS
+from balanco_hidrico_reservatorios.reservatorios import (
+    PropsCota,
+    PropsVolume,
+    Reservatorio,
+    ReservatorioONS,
+    ReservatorioSAR,
+)
+from balanco_hidrico_reservatorios.serie_temporal import SerieTemporal
+
+COLUNAS = {
+    'vazao_afluente': 'qafl',
+    'vazao_turbinada': 'qturb',
+    'vazao_retirada': 'qret',
+    'evaporacao': 'evap',
+    'precipitacao': 'prec'
+}
+
+
+def _dataframe_cav() -> pd.DataFrame:
+    cotas = np.linspace(700, 730, 31)
+    areas = 0.5 + (cotas - 700) ** 1.5 * 0.8
+    volumes = np.concatenate([[0.0], np.cumsum((areas[1:] + areas[:-1]) / 2)])
+    return pd.DataFrame({'cota': cotas, 'area': areas, 'volume': volumes})
+
+
+def _serie_temporal(freq: str, num_passos: int, vazao_retirada: float) -> SerieTemporal:
+    rng = np.random.default_rng(0)
+    if freq == 'M':
+        indice = pd.period_range('1990-01', periods=num_passos, freq='M')
+        passos_por_ano, passo_em_dias = 12, 30
+    else:
+        indice = pd.date_range('1990-01-01', periods=num_passos, freq='D')
+        passos_por_ano, passo_em_dias = 365, 1
+    sazonalidade = 1 + 0.9 * np.sin(np.arange(num_passos) * 2 * np.pi / passos_por_ano)
+    df = pd.DataFrame(
+        {
+            'qafl': rng.gamma(2, 6, num_passos) * sazonalidade,
+            'qturb': np.full(num_passos, 4.0),
+            'qret': np.full(num_passos, vazao_retirada),
+            'evap': rng.uniform(2, 8, num_passos) * passo_em_dias,
+            'prec': rng.gamma(0.5, 4, num_passos) * passo_em_dias
+        },
+        index=indice
+    )
+    return SerieTemporal(dataframe=df, nome_das_colunas=dict(COLUNAS), freq=freq)  # type: ignore
+
+
+def _cria_reservatorio(
+    freq: str = 'M',
+    num_passos: int = 240,
+    vazao_retirada: float = 6.0,
+    tipo_de_cav: str = 'sar',
+    volume_maximo: float = 300.0
+) -> Reservatorio:
+    df_cav = _dataframe_cav()
+    atributos = dict(
+        nome='teste',
+        esp_cd=None,
+        cod_sar=None,
+        area_ha=None,
+        latitude=None,
+        longitude=None,
+        volume=PropsVolume(util_total=None, maximo=volume_maximo, minimo=20.0, util=None),
+        cota=PropsCota(maxima=730, minima=700),
+        serie_temporal=_serie_temporal(freq, num_passos, vazao_retirada)
+    )
+
+    if tipo_de_cav == 'ons':
+        coeficientes = np.polynomial.Polynomial.fit(df_cav['cota'], df_cav['area'], 4).convert().coef
+        cav = CavReservatorioONS(
+            params_area_fn_cota=dict(zip('abcde', coeficientes)),  # type: ignore
+            curva_cota_volume=CurvaCotaVolumeONS(df_cav[['cota', 'volume']], 'cota', 'volume')
+        )
+        return ReservatorioONS(**atributos, cav=cav, cod_ons=None, nome_longo=None)
+
+    cav = CavReservatorio(df_cav, 'cota', 'area', 'volume')
+    return ReservatorioSAR(**atributos, cav=cav, capacidade=None)
+
+
+@pytest.fixture
+def cria_reservatorio():
+    return _cria_reservatorio
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from balanco_hidrico_reservatorios.balanco_hidrico import calcula_balanco_hidrico
+from balanco_hidrico_reservatorios.balanco_hidrico_multirresolucao import (
+    agrega_serie_temporal_mensal,
+    calcula_balanco_hidrico_multirresolucao,
+)
+from balanco_hidrico_reservatorios.indice_de_eventos import IndiceDeEventos
+from balanco_hidrico_reservatorios.serie_temporal import SerieTemporal
+
+from .conftest import COLUNAS
+
+PRIORIDADE = "Vazão das Demandas"
+DIAS_EM_DEZ_ANOS = 3652
+
+
+@pytest.fixture
+def reservatorio_diario(cria_reservatorio):
+    return cria_reservatorio(freq='D', num_passos=DIAS_EM_DEZ_ANOS, volume_maximo=100.0)
+
+
+def test_agregacao_mensal_mantem_o_mapeamento_das_colunas():
+    indice = pd.date_range('2000-01-01', '2000-03-31', freq='D')
+    df = pd.DataFrame(
+        {coluna: np.arange(len(indice), dtype=float) + i for i, coluna in enumerate(COLUNAS.values())},
+        index=indice
+    )
+    df = df[list(reversed(df.columns))]
+    serie = SerieTemporal(dataframe=df, nome_das_colunas=dict(COLUNAS), freq='D')  # type: ignore
+
+    serie_mensal = agrega_serie_temporal_mensal(serie)
+
+    assert serie_mensal.freq == 'M'
+    assert serie_mensal.nome_das_colunas == COLUNAS
+    meses = df.index.to_period('M')
+    valores = serie_mensal.valores
+    for nome in ('vazao_afluente', 'vazao_turbinada', 'vazao_retirada'):
+        np.testing.assert_allclose(getattr(valores, nome), df[COLUNAS[nome]].groupby(meses).mean())
+    for nome in ('evaporacao', 'precipitacao'):
+        np.testing.assert_allclose(getattr(valores, nome), df[COLUNAS[nome]].groupby(meses).sum())
+
+
+def test_margem_total_equivale_ao_balanco_diario(reservatorio_diario):
+    diario = calcula_balanco_hidrico(reservatorio_diario, None, 50, PRIORIDADE)
+
+    resultado = calcula_balanco_hidrico_multirresolucao(reservatorio_diario, None, 50, PRIORIDADE, margem_critica=1.0)
+
+    assert resultado['mensal'] == []
+    assert resultado['periodos_criticos'] == [(pd.Period('1990-01', 'M'), pd.Period('1999-12', 'M'))]
+    assert resultado['refinado'] == [diario]
+
+
+def test_trajetoria_continua_entre_meses_e_periodos_refinados(reservatorio_diario):
+    resultado = calcula_balanco_hidrico_multirresolucao(reservatorio_diario, None, 50, PRIORIDADE)
+    assert resultado['mensal'] and len(resultado['refinado']) > 1
+
+    trechos = [(linha['periodo'].start_time, [linha]) for linha in resultado['mensal']]
+    trechos += [(bloco[0]['periodo'], bloco) for bloco in resultado['refinado']]
+    trajetoria = [linha for _, trecho in sorted(trechos, key=lambda trecho: trecho[0]) for linha in trecho]
+
+    assert trajetoria[0]['volume_inicial_hm3'] == 20.0 + (100.0 - 20.0) * 0.5
+    for anterior, seguinte in zip(trajetoria[:-1], trajetoria[1:]):
+        assert seguinte['volume_inicial_hm3'] == anterior['volume_final_hm3']
+
+    for (inicio, fim), bloco in zip(resultado['periodos_criticos'], resultado['refinado']):
+        assert bloco[0]['periodo'] == inicio.start_time
+        assert bloco[-1]['periodo'] == fim.end_time.normalize()
+
+
+def test_resultados_mensal_e_refinado_aceitos_pelo_indice_de_eventos(reservatorio_diario):
+    resultado = calcula_balanco_hidrico_multirresolucao(reservatorio_diario, None, 50, PRIORIDADE)
+
+    IndiceDeEventos(reservatorio_diario, resultado['mensal']).sequencia_de_estados
+    for bloco in resultado['refinado']:
+        IndiceDeEventos(reservatorio_diario, bloco).sequencia_de_estados
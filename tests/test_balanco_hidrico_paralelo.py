@@ -0,0 +1,81 @@
+import pytest
+
+from balanco_hidrico_reservatorios import balanco_hidrico_paralelo
+from balanco_hidrico_reservatorios.balanco_hidrico import calcula_balanco_hidrico
+from balanco_hidrico_reservatorios.balanco_hidrico_paralelo import (
+    _simula_limites_do_trecho,
+    calcula_balanco_hidrico_paralelo_no_tempo,
+)
+from balanco_hidrico_reservatorios.calendario import calcula_fatores_q_para_vol
+
+PRIORIDADE = "Vazão das Demandas"
+
+
+def _limites_convergem(reservatorio) -> bool:
+    serie_temporal = reservatorio.serie_temporal
+    valores = serie_temporal.valores
+    entradas = (
+        valores.vazao_afluente, valores.vazao_turbinada, valores.vazao_retirada, valores.evaporacao,
+        valores.precipitacao, calcula_fatores_q_para_vol(serie_temporal.dataframe.index, serie_temporal.freq)
+    )
+    ponto_de_reinicio, _ = _simula_limites_do_trecho(
+        reservatorio.volume.minimo, reservatorio.volume.maximo, PRIORIDADE, entradas,
+        reservatorio.cav.tabela(), 'python'
+    )
+    return ponto_de_reinicio >= 0
+
+
+@pytest.mark.parametrize('num_trechos', [1, 2, 3, 7, 16])
+def test_resultado_identico_ao_sequencial(cria_reservatorio, num_trechos):
+    reservatorio = cria_reservatorio(freq='D', num_passos=1500, volume_maximo=100.0)
+    assert _limites_convergem(reservatorio)
+
+    esperado = calcula_balanco_hidrico(reservatorio, None, 30, PRIORIDADE)
+    resultado = calcula_balanco_hidrico_paralelo_no_tempo(
+        reservatorio, None, 30, PRIORIDADE, num_processos=2, num_trechos=num_trechos
+    )
+
+    assert resultado == esperado
+
+
+@pytest.mark.parametrize('num_trechos', [2, 5])
+def test_resultado_identico_quando_os_limites_nao_convergem(cria_reservatorio, num_trechos):
+    reservatorio = cria_reservatorio(freq='D', num_passos=1500, volume_maximo=5000.0)
+    assert not _limites_convergem(reservatorio)
+
+    esperado = calcula_balanco_hidrico(reservatorio, None, 30, PRIORIDADE)
+    resultado = calcula_balanco_hidrico_paralelo_no_tempo(
+        reservatorio, None, 30, PRIORIDADE, num_processos=2, num_trechos=num_trechos
+    )
+
+    assert resultado == esperado
+
+
+@pytest.mark.parametrize('num_trechos', [1, 4])
+def test_serie_de_um_unico_passo(cria_reservatorio, num_trechos):
+    reservatorio = cria_reservatorio(freq='M', num_passos=1)
+
+    esperado = calcula_balanco_hidrico(reservatorio, None, 30, PRIORIDADE)
+    resultado = calcula_balanco_hidrico_paralelo_no_tempo(
+        reservatorio, None, 30, PRIORIDADE, num_processos=2, num_trechos=num_trechos
+    )
+
+    assert len(resultado) == 1
+    assert resultado == esperado
+
+
+@pytest.mark.parametrize('num_processos, num_trechos', [(1, None), (1, 8), (4, 1)])
+def test_um_processo_ou_um_trecho_executa_sequencialmente(cria_reservatorio, monkeypatch, num_processos, num_trechos):
+    reservatorio = cria_reservatorio(freq='D', num_passos=400, volume_maximo=100.0)
+
+    def sem_pool(*args, **kwargs):
+        raise AssertionError("o pool de processos não deveria ser criado")
+
+    monkeypatch.setattr(balanco_hidrico_paralelo, 'ProcessPoolExecutor', sem_pool)
+    monkeypatch.setattr(balanco_hidrico_paralelo, '_simula_limites_do_trecho', sem_pool)
+
+    resultado = calcula_balanco_hidrico_paralelo_no_tempo(
+        reservatorio, None, 30, PRIORIDADE, num_processos=num_processos, num_trechos=num_trechos
+    )
+
+    assert resultado == calcula_balanco_hidrico(reservatorio, None, 30, PRIORIDADE)
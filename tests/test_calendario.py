@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from balanco_hidrico_reservatorios.calendario import (
+    calcula_duracao_dos_passos_em_dias,
+    calcula_fatores_q_para_vol,
+)
+from balanco_hidrico_reservatorios.serie_temporal import (
+    _checa_falhas_nas_datas_da_serie_temporal,
+    _checa_indice_da_serie_temporal,
+)
+
+
+def test_fatores_mensais_usam_os_dias_de_cada_mes():
+    indice = pd.period_range('1999-11', periods=40, freq='M')
+
+    fatores = calcula_fatores_q_para_vol(indice, freq='M')
+
+    np.testing.assert_allclose(fatores, 0.0864 * indice.days_in_month.to_numpy())
+
+
+@pytest.mark.parametrize(
+    'freq, indice, fator',
+    [
+        ('W', pd.date_range('2000-01-02', periods=60, freq='W'), 0.6048),
+        ('H', pd.date_range('2000-01-01', periods=24 * 40, freq='h'), 0.0036),
+        ('D', pd.date_range('2000-01-01', periods=400, freq='D'), 0.0864),
+    ]
+)
+def test_series_semanais_horarias_e_diarias(freq, indice, fator):
+    df = pd.DataFrame({'q': np.ones(len(indice))}, index=indice)
+
+    _checa_indice_da_serie_temporal(df, freq=freq)
+    _checa_falhas_nas_datas_da_serie_temporal(df, freq=freq)
+    fatores = calcula_fatores_q_para_vol(indice, freq=freq)
+
+    assert fatores.shape == (len(indice),)
+    np.testing.assert_allclose(fatores, fator)
+
+
+@pytest.mark.parametrize(
+    'freq, indice',
+    [
+        ('M', pd.period_range('2000-01', periods=12, freq='M')),
+        ('D', pd.date_range('2000-01-01', periods=10, freq='D')),
+    ]
+)
+def test_arrays_em_cache_sao_somente_leitura(freq, indice):
+    fatores = calcula_fatores_q_para_vol(indice, freq=freq)
+    duracao = calcula_duracao_dos_passos_em_dias(indice, freq=freq)
+
+    assert fatores is calcula_fatores_q_para_vol(indice, freq=freq)
+    for array in (fatores, duracao):
+        assert not array.flags.writeable
+        with pytest.raises(ValueError):
+            array[0] = 0.0
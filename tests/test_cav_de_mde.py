@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from balanco_hidrico_reservatorios.cav_de_mde import _abre_matriz, ajusta_polinomio_area_cota, calcula_cav_de_mde
+
+TAMANHO_DA_CELULA_M = 30.0
+
+
+def _mde_e_mascara() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    linhas, colunas = np.mgrid[0:103, 0:57]
+    elevacoes = 700 + 0.004 * ((linhas - 51) ** 2 + (colunas - 28) ** 2) + rng.normal(0, 0.5, linhas.shape)
+    elevacoes[rng.random(elevacoes.shape) < 0.02] = np.nan
+    mascara = rng.random(elevacoes.shape) < 0.9
+    return elevacoes, mascara
+
+
+def _cav_por_celula(elevacoes: np.ndarray, mascara: np.ndarray, cotas: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    area_da_celula_km2 = TAMANHO_DA_CELULA_M ** 2 / 1e6
+    areas, volumes = [], []
+    for cota in cotas:
+        area, volume = 0.0, 0.0
+        for elevacao, inundavel in zip(elevacoes.ravel().tolist(), mascara.ravel().tolist()):
+            if inundavel and not np.isnan(elevacao) and elevacao <= cota:
+                area += area_da_celula_km2
+                volume += (cota - elevacao) * area_da_celula_km2
+        areas.append(area)
+        volumes.append(volume)
+    return np.array(areas), np.array(volumes)
+
+
+@pytest.mark.parametrize('linhas_por_bloco', [1, 10, 64, 1024])
+def test_cav_igual_a_soma_por_celula(linhas_por_bloco):
+    elevacoes, mascara = _mde_e_mascara()
+    cotas = np.linspace(698, 712, 15)
+
+    df_cav = calcula_cav_de_mde(elevacoes, TAMANHO_DA_CELULA_M, mascara, cotas, linhas_por_bloco=linhas_por_bloco)
+
+    areas, volumes = _cav_por_celula(elevacoes, mascara, cotas)
+    assert list(df_cav.columns) == ['cota_m', 'area_km2', 'volume_hm3']
+    np.testing.assert_array_equal(df_cav['cota_m'], cotas)
+    np.testing.assert_allclose(df_cav['area_km2'], areas, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(df_cav['volume_hm3'], volumes, rtol=1e-9, atol=1e-9)
+
+
+def test_arquivos_npy_lidos_com_memory_map(tmp_path):
+    elevacoes, mascara = _mde_e_mascara()
+    np.save(tmp_path / 'mde.npy', elevacoes)
+    np.save(tmp_path / 'mascara.npy', mascara)
+    cotas = np.arange(700.0, 711.0)
+    assert isinstance(_abre_matriz(tmp_path / 'mde.npy'), np.memmap)
+
+    df_cav = calcula_cav_de_mde(
+        str(tmp_path / 'mde.npy'), TAMANHO_DA_CELULA_M, tmp_path / 'mascara.npy', cotas, linhas_por_bloco=7
+    )
+
+    df_esperado = calcula_cav_de_mde(elevacoes, TAMANHO_DA_CELULA_M, mascara, cotas)
+    np.testing.assert_allclose(df_cav.to_numpy(), df_esperado.to_numpy(), rtol=1e-12)
+
+
+def test_paraboloide_analitico():
+    tamanho_da_celula_m = 1.0
+    coordenadas = (np.arange(2001) - 1000) * tamanho_da_celula_m
+    x, y = np.meshgrid(coordenadas, coordenadas)
+    raio_quadrado = x ** 2 + y ** 2
+    elevacoes = 1e-3 * raio_quadrado
+    cotas = np.array([100.0, 400.0, 900.0])
+
+    df_cav = calcula_cav_de_mde(elevacoes, tamanho_da_celula_m, raio_quadrado <= 1000 ** 2, cotas)
+
+    areas_m2 = np.pi * cotas / 1e-3
+    np.testing.assert_allclose(df_cav['area_km2'], areas_m2 / 1e6, rtol=2e-3)
+    np.testing.assert_allclose(df_cav['volume_hm3'], areas_m2 * cotas / 2 / 1e6, rtol=2e-3)
+
+
+@pytest.mark.parametrize('argumentos', [
+    dict(elevacoes=np.zeros((3, 3)), mascara=np.ones((3, 2), dtype=bool)),
+    dict(tamanho_da_celula_m=0.0),
+    dict(linhas_por_bloco=0),
+    dict(cotas=np.array([1.0, 1.0])),
+])
+def test_argumentos_invalidos(argumentos):
+    parametros = dict(
+        elevacoes=np.zeros((3, 3)), tamanho_da_celula_m=1.0, mascara=np.ones((3, 3), dtype=bool),
+        cotas=np.array([0.0, 1.0])
+    )
+    with pytest.raises(ValueError):
+        calcula_cav_de_mde(**{**parametros, **argumentos})
+
+
+def test_polinomio_ajustado_reproduz_area_polinomial():
+    cotas = np.linspace(700, 730, 31)
+    areas = 0.5 + 0.1 * (cotas - 700) + 0.002 * (cotas - 700) ** 2
+
+    parametros = ajusta_polinomio_area_cota(cotas, areas)
+
+    area_calculada = sum(parametros[nome] * cotas ** i for i, nome in enumerate('abcde'))
+    np.testing.assert_allclose(area_calculada, areas, rtol=1e-6)
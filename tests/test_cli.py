@@ -0,0 +1,62 @@
+import json
+
+import pandas as pd
+import pytest
+
+from balanco_hidrico_reservatorios.balanco_hidrico import calcula_balanco_hidrico
+from balanco_hidrico_reservatorios.cli import main
+
+from .conftest import COLUNAS, _cria_reservatorio, _dataframe_cav
+
+NOMES = ('Orós', 'Castanhão')
+
+
+def _reservatorio(nome: str, **sobrescritas) -> dict:
+    return {
+        'nome': nome,
+        'volume': {'maximo': 300.0, 'minimo': 20.0},
+        'cota': {'maxima': 730.0, 'minima': 700.0},
+        'cav': {'arquivo': 'cav.csv', 'coluna_cota': 'cota', 'coluna_area': 'area', 'coluna_volume': 'volume'},
+        'serie_temporal': {'arquivo': 'serie.csv', 'coluna_data': 'data', 'freq': 'M', 'colunas': COLUNAS},
+        'percentual_volume_inicial': 30,
+        'prioridade_de_atendimento': "Vazão das Demandas",
+        **sobrescritas
+    }
+
+
+@pytest.fixture
+def diretorio_do_trabalho(tmp_path):
+    reservatorio = _cria_reservatorio()
+    _dataframe_cav().to_csv(tmp_path / 'cav.csv', index=False)
+    df_serie = reservatorio.serie_temporal.dataframe
+    df_serie.set_axis(df_serie.index.to_timestamp()).rename_axis('data').to_csv(tmp_path / 'serie.csv')
+    return tmp_path
+
+
+def _escreve_trabalhos(diretorio, reservatorios: list[dict]):
+    arquivo = diretorio / 'trabalhos.json'
+    arquivo.write_text(json.dumps({'execucao': {'diretorio_de_saida': 'saida'}, 'reservatorios': reservatorios}))
+    return arquivo
+
+
+def test_main_executa_os_reservatorios_em_processos(diretorio_do_trabalho):
+    arquivo = _escreve_trabalhos(diretorio_do_trabalho, [_reservatorio(nome) for nome in NOMES])
+
+    assert main([str(arquivo), '-p', '2']) == 0
+
+    esperado = pd.DataFrame(calcula_balanco_hidrico(_cria_reservatorio(), None, 30, "Vazão das Demandas"))
+    esperado['periodo'] = esperado['periodo'].astype(str)
+    for nome in NOMES:
+        resultado = pd.read_csv(diretorio_do_trabalho / 'saida' / nome / 'balanco_hidrico.csv', dtype={'periodo': str})
+        pd.testing.assert_frame_equal(resultado, esperado)
+
+
+def test_main_rejeita_prioridade_invalida_antes_de_executar(diretorio_do_trabalho, capsys):
+    arquivo = _escreve_trabalhos(diretorio_do_trabalho, [
+        _reservatorio(NOMES[0]), _reservatorio(NOMES[1], prioridade_de_atendimento="Vazao das Demandas")
+    ])
+
+    assert main([str(arquivo), '-p', '2']) == 2
+
+    assert "Vazao das Demandas" in capsys.readouterr().err
+    assert not (diretorio_do_trabalho / 'saida').exists()
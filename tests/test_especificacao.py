@@ -0,0 +1,51 @@
+import pytest
+
+from balanco_hidrico_reservatorios.especificacao import EspecificacaoInvalida, carrega_especificacao
+
+RESERVATORIO = '''
+[[reservatorios]]
+nome = "teste"
+volume = { maximo = 300.0, minimo = 20.0 }
+cota = { maxima = 730.0, minima = 700.0 }
+cav = { arquivo = "cav.csv", coluna_cota = "cota", coluna_area = "area", coluna_volume = "volume" }
+serie_temporal = { arquivo = "serie.csv", coluna_data = "data", freq = "M", colunas = {} }
+'''
+
+
+@pytest.mark.parametrize('execucao', [
+    'formato = "json"',
+    'backend = "cython"',
+    'processos = 0',
+    'pre_carregamento = -1',
+    'processos = "4"',
+])
+def test_execucao_invalida_e_rejeitada_ao_carregar(tmp_path, execucao):
+    arquivo = tmp_path / 'trabalhos.toml'
+    arquivo.write_text(f"[execucao]\n{execucao}\n{RESERVATORIO}", encoding='utf-8')
+
+    with pytest.raises(EspecificacaoInvalida):
+        carrega_especificacao(arquivo)
+
+
+def test_execucao_padrao_e_valida(tmp_path):
+    arquivo = tmp_path / 'trabalhos.toml'
+    arquivo.write_text(RESERVATORIO, encoding='utf-8')
+
+    execucao = carrega_especificacao(arquivo)['execucao']
+
+    assert (execucao['formato'], execucao['backend'], execucao['processos']) == ('csv', 'python', 1)
+
+
+@pytest.mark.parametrize('antigo, novo', [
+    ('nome = "teste"', 'nome = "teste"\nprioridade_de_atendimento = "Vazao das Demandas"'),
+    ('nome = "teste"', 'nome = "teste"\npercentual_volume_inicial = 120'),
+    ('nome = "teste"', 'nome = "teste"\npercentual_volume_inicial = -1'),
+    ('nome = "teste"', 'nome = "teste"\npercentual_volume_inicial = "50"'),
+    ('freq = "M"', 'freq = "Y"'),
+])
+def test_reservatorio_invalido_e_rejeitado_ao_carregar(tmp_path, antigo, novo):
+    arquivo = tmp_path / 'trabalhos.toml'
+    arquivo.write_text(RESERVATORIO.replace(antigo, novo), encoding='utf-8')
+
+    with pytest.raises(EspecificacaoInvalida):
+        carrega_especificacao(arquivo)
@@ -0,0 +1,107 @@
+import pandas as pd
+import pytest
+
+from balanco_hidrico_reservatorios.exportacao import exporta_resultados, exporta_resultados_da_frota
+
+
+def test_parquet_promove_colunas_inteiras_e_nulas_do_primeiro_lote_para_float(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    linhas = [{'a': 1, 'b': None}] * 3 + [{'a': 1.5, 'b': 2.0}] * 3
+
+    caminho = exporta_resultados(linhas, tmp_path / 'resultado.parquet', tamanho_do_lote=3)
+
+    assert pq.read_table(caminho).to_pydict() == {'a': [1.0] * 3 + [1.5] * 3, 'b': [None] * 3 + [2.0] * 3}
+
+
+def test_parquet_remove_arquivo_parcial_em_caso_de_erro(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    linhas = [{'a': 1.0}] * 3 + [{'a': 'texto'}] * 3
+    caminho = tmp_path / 'resultado.parquet'
+
+    with pytest.raises(pa.ArrowInvalid):
+        exporta_resultados(linhas, caminho, tamanho_do_lote=3)
+
+    assert not caminho.exists()
+
+
+LINHAS = [
+    {'periodo': pd.Period('2000-01', 'M'), 'volume_final_hm3': 10.5, 'evaporacao_mm': 3.0, 'precipitacao_mm': 1.0},
+    {'periodo': pd.Period('2000-02', 'M'), 'volume_final_hm3': 9.5, 'precipitacao_mm': 2.0, 'evaporacao_mm': 4.0},
+]
+ESPERADO = {
+    'periodo': ['2000-01', '2000-02'],
+    'volume_final_hm3': [10.5, 9.5],
+    'evaporacao_mm': [3.0, 4.0],
+    'precipitacao_mm': [1.0, 2.0]
+}
+
+
+def _le_csv(caminho) -> dict[str, list]:
+    df = pd.read_csv(caminho, dtype={'periodo': str})
+    return {coluna: df[coluna].tolist() for coluna in df.columns}
+
+
+def _le_xlsx(caminho, nome_da_aba=None) -> dict[str, list]:
+    openpyxl = pytest.importorskip("openpyxl")
+    planilha = openpyxl.load_workbook(caminho, read_only=True)
+    aba = planilha[nome_da_aba] if nome_da_aba else planilha.worksheets[0]
+    colunas, *linhas = list(aba.values)
+    return {coluna: [linha[i] for linha in linhas] for i, coluna in enumerate(colunas)}
+
+
+def _le_parquet(caminho) -> dict[str, list]:
+    pq = pytest.importorskip("pyarrow.parquet")
+    return pq.read_table(caminho).to_pydict()
+
+
+LEITORES = {'csv': _le_csv, 'xlsx': _le_xlsx, 'parquet': _le_parquet}
+
+
+@pytest.mark.parametrize('formato', ['csv', 'xlsx', 'parquet'])
+def test_ida_e_volta_com_ordem_de_chaves_diferente_entre_linhas(tmp_path, formato):
+    if formato == 'xlsx':
+        pytest.importorskip("openpyxl")
+
+    caminho = exporta_resultados(LINHAS, tmp_path / f'resultado.{formato}', tamanho_do_lote=1)
+
+    assert LEITORES[formato](caminho) == ESPERADO
+
+
+@pytest.mark.parametrize('formato', ['csv', 'parquet'])
+@pytest.mark.parametrize('particionado', [False, True])
+def test_frota_um_arquivo_por_reservatorio(tmp_path, formato, particionado):
+    if formato == 'parquet':
+        pytest.importorskip("pyarrow")
+    resultados = {'Orós': LINHAS, '../Castanhão/2': LINHAS[:1]}
+
+    caminhos = exporta_resultados_da_frota(resultados, tmp_path / 'saida', formato, particionado=particionado)
+
+    if particionado:
+        esperados = [
+            tmp_path / 'saida' / 'reservatorio=Orós' / f'parte-0.{formato}',
+            tmp_path / 'saida' / 'reservatorio=_Castanhão_2' / f'parte-0.{formato}'
+        ]
+    else:
+        esperados = [tmp_path / 'saida' / f'Orós.{formato}', tmp_path / 'saida' / f'_Castanhão_2.{formato}']
+    assert caminhos == esperados
+    assert sorted(tmp_path.rglob(f'*.{formato}')) == sorted(esperados)
+    assert LEITORES[formato](caminhos[0]) == ESPERADO
+    assert LEITORES[formato](caminhos[1]) == {coluna: valores[:1] for coluna, valores in ESPERADO.items()}
+
+
+def test_frota_particionada_em_planilha_com_uma_aba_por_reservatorio(tmp_path):
+    pytest.importorskip("openpyxl")
+    resultados = {'Orós': LINHAS, 'Açude [Norte]: ' + 'x' * 40: LINHAS[:1]}
+
+    caminhos = exporta_resultados_da_frota(resultados, tmp_path, 'xlsx', particionado=True)
+
+    assert caminhos == [tmp_path / 'frota.xlsx']
+    assert _le_xlsx(caminhos[0], 'Orós') == ESPERADO
+    assert _le_xlsx(caminhos[0], ('Açude _Norte__ ' + 'x' * 40)[:31]) == {
+        coluna: valores[:1] for coluna, valores in ESPERADO.items()
+    }
+
+
+def test_frota_com_nomes_repetidos_apos_adaptacao(tmp_path):
+    with pytest.raises(ValueError):
+        exporta_resultados_da_frota({'a/b': LINHAS, 'a_b': LINHAS}, tmp_path, 'csv')
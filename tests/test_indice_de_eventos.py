@@ -0,0 +1,173 @@
+from itertools import groupby
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from balanco_hidrico_reservatorios.balanco_hidrico import calcula_balanco_hidrico
+from balanco_hidrico_reservatorios.indice_de_eventos import IndiceDeEventos
+
+VOLUME_MINIMO = 20.0
+VOLUME_MAXIMO = 300.0
+
+
+def _resultados(volumes_finais: list[float], volumes_vertidos: list[float]) -> list[dict]:
+    periodos = pd.period_range('2000-01', periods=len(volumes_finais), freq='M')
+    return [
+        {'periodo': periodo, 'volume_final_hm3': volume_final, 'volume_vertido_hm3': volume_vertido}
+        for periodo, volume_final, volume_vertido in zip(periodos, volumes_finais, volumes_vertidos)
+    ]
+
+
+def _resultados_aleatorios(semente: int, num_passos: int) -> list[dict]:
+    rng = np.random.default_rng(semente)
+    volumes_finais, volumes_vertidos = [], []
+    categoria = 0
+    for _ in range(num_passos):
+        if rng.random() < 0.35:
+            categoria = int(rng.integers(4))
+        volume_final, volume_vertido = [
+            (VOLUME_MAXIMO, float(rng.uniform(0.1, 5))),
+            (VOLUME_MAXIMO, 0.0),
+            (VOLUME_MINIMO, 0.0),
+            (float(rng.uniform(VOLUME_MINIMO + 1, VOLUME_MAXIMO - 1)), 0.0)
+        ][categoria]
+        volumes_finais.append(volume_final)
+        volumes_vertidos.append(volume_vertido)
+    return _resultados(volumes_finais, volumes_vertidos)
+
+
+def _estados(resultados: list[dict]) -> list[str]:
+    return [
+        "Vertimento" if resultado['volume_vertido_hm3'] > 0
+        else "Déficit" if resultado['volume_final_hm3'] <= VOLUME_MINIMO else "Normal"
+        for resultado in resultados
+    ]
+
+
+def _secas(resultados: list[dict]) -> list[tuple[int, int]]:
+    secas, posicao = [], 0
+    for estado, grupo in groupby(_estados(resultados)):
+        tamanho = len(list(grupo))
+        if estado == "Déficit":
+            secas.append((posicao, posicao + tamanho - 1))
+        posicao += tamanho
+    return secas
+
+
+def _deplecionamentos(resultados: list[dict]) -> list[tuple[int, int]]:
+    fim_do_ciclo: dict[int, int] = {}
+    ultimo_cheio = None
+    for i, (resultado, estado) in enumerate(zip(resultados, _estados(resultados))):
+        if resultado['volume_final_hm3'] >= VOLUME_MAXIMO:
+            ultimo_cheio = i
+        if estado == "Déficit" and ultimo_cheio is not None:
+            fim_do_ciclo[ultimo_cheio] = i
+    return [(cheio + 1, fim) for cheio, fim in fim_do_ciclo.items()]
+
+
+def _evento(resultados: list[dict], inicio: int, fim: int) -> dict:
+    return {
+        'estado': "Déficit",
+        'periodo_inicial': resultados[inicio]['periodo'],
+        'periodo_final': resultados[fim]['periodo'],
+        'numero_de_periodos': fim - inicio + 1
+    }
+
+
+@pytest.fixture
+def reservatorio(cria_reservatorio):
+    return cria_reservatorio(volume_maximo=VOLUME_MAXIMO)
+
+
+@pytest.mark.parametrize('semente', range(5))
+def test_estados_e_secas_contra_varredura(reservatorio, semente):
+    resultados = _resultados_aleatorios(semente, 200)
+    indice = IndiceDeEventos(reservatorio, resultados)  # type: ignore
+
+    estados = _estados(resultados)
+    assert [indice.estado_no_periodo(resultado['periodo']) for resultado in resultados] == estados
+    assert sum(evento['numero_de_periodos'] for evento in indice.sequencia_de_estados) == len(resultados)
+
+    secas = sorted(_secas(resultados), key=lambda seca: seca[0] - seca[1])
+    for k in (0, 1, 3, len(secas), len(secas) + 5):
+        assert indice.maiores_secas(k) == [_evento(resultados, inicio, fim) for inicio, fim in secas[:k]]
+
+
+@pytest.mark.parametrize('semente', range(5))
+def test_periodo_critico_contra_varredura(reservatorio, semente):
+    resultados = _resultados_aleatorios(semente, 200)
+    indice = IndiceDeEventos(reservatorio, resultados)  # type: ignore
+
+    posicao = {resultado['periodo']: i for i, resultado in enumerate(resultados)}
+    deplecionamentos = _deplecionamentos(resultados)
+    assert [
+        (posicao[deplecionamento['periodo_inicial']], posicao[deplecionamento['periodo_final']])
+        for deplecionamento in indice.deplecionamentos
+    ] == deplecionamentos
+
+    critico = indice.periodo_critico()
+    if not deplecionamentos:
+        assert critico is None
+    else:
+        inicio, fim = max(deplecionamentos, key=lambda deplecionamento: deplecionamento[1] - deplecionamento[0])
+        assert critico == {
+            'periodo_inicial': resultados[inicio]['periodo'],
+            'periodo_final': resultados[fim]['periodo'],
+            'numero_de_periodos': fim - inicio + 1
+        }
+
+
+def test_periodos_de_deficit_contra_varredura(reservatorio):
+    resultados = _resultados_aleatorios(11, 40)
+    indice = IndiceDeEventos(reservatorio, resultados)  # type: ignore
+    periodos = [resultado['periodo'] for resultado in resultados]
+    secas = _secas(resultados)
+    assert len(secas) > 3
+
+    limites = [periodos[0] - 3, *periodos, periodos[-1] + 3]
+    for inicio in limites:
+        for fim in limites:
+            esperado = [
+                _evento(resultados, inicio_seca, fim_seca) for inicio_seca, fim_seca in secas
+                if any(inicio <= periodos[i] <= fim for i in range(inicio_seca, fim_seca + 1))
+            ]
+            assert indice.periodos_de_deficit(inicio, fim) == esperado, (inicio, fim)
+
+
+def test_resultado_vazio(reservatorio):
+    indice = IndiceDeEventos(reservatorio, [])
+
+    assert indice.sequencia_de_estados == []
+    assert indice.deplecionamentos == []
+    assert indice.periodo_critico() is None
+    assert indice.maiores_secas(3) == []
+    assert indice.periodos_de_deficit(pd.Period('2000-01', 'M'), pd.Period('2001-01', 'M')) == []
+    with pytest.raises(KeyError):
+        indice.estado_no_periodo(pd.Period('2000-01', 'M'))
+
+
+@pytest.mark.parametrize(
+    'volume_final, volume_vertido, estado',
+    [(VOLUME_MAXIMO, 2.0, "Vertimento"), (VOLUME_MINIMO, 0.0, "Déficit"), (150.0, 0.0, "Normal")]
+)
+def test_resultado_de_um_unico_passo(reservatorio, volume_final, volume_vertido, estado):
+    resultados = _resultados([volume_final], [volume_vertido])
+    indice = IndiceDeEventos(reservatorio, resultados)  # type: ignore
+    periodo = resultados[0]['periodo']
+
+    assert indice.estado_no_periodo(periodo) == estado
+    assert indice.periodo_critico() is None
+    secas = [_evento(resultados, 0, 0)] if estado == "Déficit" else []
+    assert indice.maiores_secas(2) == secas
+    assert indice.periodos_de_deficit(periodo, periodo) == secas
+    with pytest.raises(KeyError):
+        indice.estado_no_periodo(periodo + 1)
+
+
+def test_balanco_hidrico_do_reservatorio(reservatorio):
+    resultados = calcula_balanco_hidrico(reservatorio, None, 50, "Vazão das Demandas")
+    indice = IndiceDeEventos(reservatorio, resultados)
+
+    assert [indice.estado_no_periodo(resultado['periodo']) for resultado in resultados] == _estados(resultados)
+    assert indice.maiores_secas(1)[0]['numero_de_periodos'] == max(fim - inicio + 1 for inicio, fim in _secas(resultados))
@@ -0,0 +1,68 @@
+import threading
+import time
+
+import pytest
+
+from balanco_hidrico_reservatorios.ingestao import carrega_antecipadamente
+
+
+def _espera(condicao, tempo_limite: float = 5.0) -> None:
+    limite = time.monotonic() + tempo_limite
+    while not condicao():
+        assert time.monotonic() < limite
+        time.sleep(0.001)
+
+
+def test_itens_entregues_na_ordem_de_entrada():
+    def carregador(item: int) -> int:
+        time.sleep(0.001 * (10 - item))
+        return item * 10
+
+    entregues = [(item, futuro.result()) for item, futuro in carrega_antecipadamente(range(10), carregador, 3)]
+
+    assert entregues == [(item, item * 10) for item in range(10)]
+
+
+@pytest.mark.parametrize('profundidade', [1, 2, 4])
+def test_no_maximo_profundidade_carregamentos_a_frente(profundidade):
+    iniciados: list[int] = []
+    liberados = {item: threading.Event() for item in range(10)}
+
+    def carregador(item: int) -> int:
+        iniciados.append(item)
+        liberados[item].wait(5)
+        return item
+
+    gerador = carrega_antecipadamente(range(10), carregador, profundidade, num_threads=10)
+    for atual in range(10):
+        item, futuro = next(gerador)
+        assert item == atual
+        esperados = list(range(min(atual + profundidade + 1, 10)))
+        _espera(lambda: len(iniciados) >= len(esperados))
+        time.sleep(0.02)
+        assert sorted(iniciados) == esperados
+        liberados[atual].set()
+        assert futuro.result() == atual
+
+    assert next(gerador, None) is None
+
+
+def test_falha_em_um_carregamento_nao_interrompe_os_demais():
+    def carregador(item: int) -> int:
+        if item == 2:
+            raise OSError("arquivo ausente")
+        return item
+
+    resultados = []
+    for item, futuro in carrega_antecipadamente(range(5), carregador, 2):
+        try:
+            resultados.append(futuro.result())
+        except OSError as erro:
+            resultados.append(str(erro))
+
+    assert resultados == [0, 1, "arquivo ausente", 3, 4]
+
+
+def test_profundidade_invalida():
+    with pytest.raises(ValueError):
+        next(carrega_antecipadamente(range(3), str, 0))
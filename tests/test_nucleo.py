@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from balanco_hidrico_reservatorios.balanco_hidrico import calcula_balanco_hidrico
+
+
+@pytest.mark.parametrize('tipo_de_cav', ['sar', 'ons'])
+@pytest.mark.parametrize('freq, num_passos, volume_maximo', [('D', 1500, 100.0), ('M', 240, 300.0)])
+@pytest.mark.parametrize('prioridade', ["Vazão das Demandas", "Vazão Turbinada"])
+def test_backends_python_e_numba_produzem_os_mesmos_resultados(
+    cria_reservatorio, tipo_de_cav, freq, num_passos, volume_maximo, prioridade
+):
+    pytest.importorskip("numba")
+    reservatorio = cria_reservatorio(
+        freq=freq, num_passos=num_passos, tipo_de_cav=tipo_de_cav, volume_maximo=volume_maximo
+    )
+
+    resultado_python = calcula_balanco_hidrico(reservatorio, None, 30, prioridade, backend='python')
+    resultado_numba = calcula_balanco_hidrico(reservatorio, None, 30, prioridade, backend='numba')
+
+    assert any(resultado['volume_vertido_hm3'] > 0 for resultado in resultado_python)
+    assert any(resultado['volume_final_hm3'] <= reservatorio.volume.minimo for resultado in resultado_python)
+    assert resultado_python == resultado_numba
+
+
+@pytest.mark.parametrize('backend', ['python', 'numba'])
+def test_prioridade_invalida(cria_reservatorio, backend):
+    if backend == 'numba':
+        pytest.importorskip("numba")
+
+    with pytest.raises(ValueError, match="Prioridade de atendimento inválida"):
+        calcula_balanco_hidrico(cria_reservatorio(), None, 30, "Vazao das Demandas", backend=backend)  # type: ignore
+
+
+def test_nucleo_em_arrays_nao_carrega_pandas():
+    codigo = """
+import sys
+import numpy as np
+import balanco_hidrico_reservatorios.cli
+from balanco_hidrico_reservatorios.nucleo import TabelaCav, calcula_balanco_hidrico_em_arrays
+
+tabela_cav = TabelaCav(cotas=np.array([700.0, 710.0]), areas=np.array([1.0, 2.0]), volumes=np.array([0.0, 15.0]))
+passos = np.ones(12)
+calcula_balanco_hidrico_em_arrays(
+    10.0, 2.0, 15.0, "Vazão das Demandas", passos, passos, passos, passos, passos, passos * 2.592, tabela_cav
+)
+assert 'pandas' not in sys.modules
+"""
+    subprocess.run([sys.executable, '-c', codigo], check=True, cwd=Path(__file__).parents[1])
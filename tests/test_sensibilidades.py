@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from balanco_hidrico_reservatorios.balanco_hidrico import calcula_balanco_hidrico
+from balanco_hidrico_reservatorios.calendario import calcula_fatores_q_para_vol
+from balanco_hidrico_reservatorios.sensibilidades import calcula_sensibilidades
+
+PRIORIDADE = "Vazão das Demandas"
+PASSO = 1e-6
+
+
+def _saidas(reservatorio) -> np.ndarray:
+    serie_temporal = reservatorio.serie_temporal
+    df_serie = serie_temporal.dataframe
+    resultado = calcula_balanco_hidrico(reservatorio, None, 30, PRIORIDADE)
+    fatores_q_para_vol = calcula_fatores_q_para_vol(df_serie.index, serie_temporal.freq)
+    deficit = sum(
+        (vazao_retirada - periodo['vazao_demandas_m3_s'] + vazao_turbinada - periodo['vazao_turbinada_m3_s']) * fator
+        for periodo, vazao_retirada, vazao_turbinada, fator
+        in zip(resultado, df_serie['qret'], df_serie['qturb'], fatores_q_para_vol)
+    )
+    return np.array([
+        resultado[-1]['volume_final_hm3'],
+        sum(periodo['volume_vertido_hm3'] for periodo in resultado),
+        deficit
+    ])
+
+
+def _diferenca_central(reservatorio, perturba) -> np.ndarray:
+    perturba(PASSO)
+    acima = _saidas(reservatorio)
+    perturba(-2 * PASSO)
+    abaixo = _saidas(reservatorio)
+    perturba(PASSO)
+    return (acima - abaixo) / (2 * PASSO)
+
+
+def _derivadas(sensibilidades, parametro, indice=None) -> np.ndarray:
+    derivadas = [sensibilidades[saida]['derivadas'][parametro] for saida in sensibilidades]
+    return np.array(derivadas if indice is None else [derivada[indice] for derivada in derivadas])
+
+
+@pytest.fixture
+def reservatorio(cria_reservatorio):
+    reservatorio = cria_reservatorio(freq='M', num_passos=240, vazao_retirada=6.0)
+    volumes_da_cav = reservatorio.cav.cav['volume'].to_numpy()
+    assert np.min(np.abs(volumes_da_cav - reservatorio.volume.maximo)) > 1.0
+    return reservatorio
+
+
+def test_valores_iguais_aos_do_balanco_hidrico(reservatorio):
+    sensibilidades = calcula_sensibilidades(reservatorio, None, 30, PRIORIDADE)
+
+    valores = [sensibilidades[saida]['valor'] for saida in sensibilidades]
+
+    assert valores == _saidas(reservatorio).tolist()
+
+
+@pytest.mark.parametrize('parametro, coluna', [('evaporacao', 'evap'), ('vazao_retirada', 'qret')])
+def test_deslocamentos_uniformes_conferem_com_diferencas_finitas(reservatorio, parametro, coluna):
+    sensibilidades = calcula_sensibilidades(reservatorio, None, 30, PRIORIDADE)
+    df_serie = reservatorio.serie_temporal.dataframe
+
+    def perturba(passo):
+        df_serie[coluna] = df_serie[coluna] + passo
+
+    np.testing.assert_allclose(
+        _derivadas(sensibilidades, parametro), _diferenca_central(reservatorio, perturba), rtol=1e-5, atol=1e-6
+    )
+
+
+def test_volume_maximo_confere_com_diferencas_finitas(reservatorio):
+    sensibilidades = calcula_sensibilidades(reservatorio, None, 30, PRIORIDADE)
+
+    def perturba(passo):
+        reservatorio.volume.maximo += passo
+
+    np.testing.assert_allclose(
+        _derivadas(sensibilidades, 'volume_maximo'), _diferenca_central(reservatorio, perturba), rtol=1e-5, atol=1e-6
+    )
+
+
+@pytest.mark.parametrize('indice', [3, 10, 20])
+def test_areas_da_cav_conferem_com_diferencas_finitas(reservatorio, indice):
+    sensibilidades = calcula_sensibilidades(reservatorio, None, 30, PRIORIDADE)
+    df_cav = reservatorio.cav.cav
+
+    def perturba(passo):
+        df_cav.loc[df_cav.index[indice], 'area'] += passo
+
+    np.testing.assert_allclose(
+        _derivadas(sensibilidades, 'areas_cav', indice), _diferenca_central(reservatorio, perturba),
+        rtol=1e-5, atol=1e-6
+    )
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from balanco_hidrico_reservatorios.curva_de_regularização import gera_curva_de_regularizacao
+from balanco_hidrico_reservatorios.serie_temporal import NomeDaColunaInvalida, SerieTemporalInvalida
+
+
+def test_curva_de_regularizacao_nao_altera_o_dataframe(cria_reservatorio):
+    reservatorio = cria_reservatorio(num_passos=120)
+    df_serie = reservatorio.serie_temporal.dataframe
+    df_original = df_serie.copy()
+
+    curva = gera_curva_de_regularizacao(reservatorio, reservatorio.serie_temporal, (0.0, 30.0))
+
+    assert curva
+    assert df_serie.equals(df_original)
+    assert reservatorio.serie_temporal.substituicoes == {}
+
+
+def test_valores_sao_somente_leitura_e_aplicam_substituicoes(cria_reservatorio):
+    serie = cria_reservatorio(num_passos=24).serie_temporal
+    vazoes_retiradas = np.arange(24, dtype=float)
+
+    valores = serie.com_substituicoes(vazao_turbinada=0.0, vazao_retirada=vazoes_retiradas).valores
+
+    assert np.array_equal(valores.vazao_turbinada, np.zeros(24))
+    assert np.array_equal(valores.vazao_retirada, vazoes_retiradas)
+    assert np.array_equal(valores.vazao_afluente, serie.dataframe['qafl'].to_numpy())
+    for valor in valores:
+        assert not valor.flags.writeable
+
+
+def test_recorta_preserva_as_substituicoes(cria_reservatorio):
+    serie = cria_reservatorio(num_passos=24).serie_temporal
+    serie = serie.com_substituicoes(vazao_turbinada=1.5, vazao_retirada=np.arange(24, dtype=float))
+    indice = serie.dataframe.index
+
+    recorte = serie.recorta(indice[6], indice[11])
+
+    assert recorte.dataframe.index.equals(indice[6:12])
+    assert np.array_equal(recorte.valores.vazao_retirada, np.arange(6, 12, dtype=float))
+    assert np.array_equal(recorte.valores.vazao_turbinada, np.full(6, 1.5))
+
+
+@pytest.mark.parametrize('tamanho', [23, 25])
+def test_substituicao_com_tamanho_diferente_da_serie(cria_reservatorio, tamanho):
+    serie = cria_reservatorio(num_passos=24).serie_temporal
+
+    with pytest.raises(SerieTemporalInvalida):
+        serie.com_substituicoes(vazao_retirada=np.ones(tamanho))
+
+
+def test_substituicao_de_coluna_inexistente(cria_reservatorio):
+    serie = cria_reservatorio(num_passos=24).serie_temporal
+
+    with pytest.raises(NomeDaColunaInvalida):
+        serie.com_substituicoes(vazao_vertida=0.0)